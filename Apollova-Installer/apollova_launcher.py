@@ -7,9 +7,10 @@ Zero terminal output. Every failure shows a friendly GUI dialog.
 import os
 import sys
 import json
+import hashlib
+import html
+import shutil
 import subprocess
-import threading
-import time
 from datetime import datetime
 from pathlib import Path
 
@@ -17,7 +18,7 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QProgressBar, QFrame, QMessageBox, QPushButton,
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject
+from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QObject
 from PyQt6.QtGui import QFont, QIcon
 
 # Logger setup
@@ -35,6 +36,16 @@ except Exception:
 
 SUPPORT_EMAIL = "support@apollova.app"
 
+# Subprocess window flags — resolved once, shared by every check.
+# _SI hides console children only; the GUI launch must not inherit SW_HIDE.
+_WIN = sys.platform == "win32"
+_CF  = subprocess.CREATE_NO_WINDOW if _WIN else 0
+_SI  = None
+if _WIN:
+    _SI = subprocess.STARTUPINFO()
+    _SI.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _SI.wShowWindow = subprocess.SW_HIDE
+
 STYLE = """
 QMainWindow, QWidget {
     background-color: #1e1e2e;
@@ -88,6 +99,7 @@ REQUIRED_FILES = [
     "assets/apollova_gui.py",
     "assets/apollova_license.py",
     "assets/apollova_activation_dialog.py",
+    "assets/apollova.qss",
     "assets/scripts/config.py",
     "assets/scripts/audio_processing.py",
     "assets/scripts/image_processing.py",
@@ -112,6 +124,26 @@ REQUIRED_DIRS = [
 ]
 
 
+def _is_running_python(path: str) -> bool:
+    """True if `path` is the interpreter already running this launcher."""
+    if getattr(sys, "frozen", False):
+        return False
+    try:
+        exe = shutil.which(path) or path
+        return Path(exe).resolve() == Path(sys.executable).resolve()
+    except Exception:
+        return False
+
+
+def _read_json(path):
+    """Load a small JSON file as raw bytes (no text decode); None on failure."""
+    try:
+        with open(path, "rb") as f:
+            return json.loads(f.read())
+    except Exception:
+        return None
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 #  Signals
 # ─────────────────────────────────────────────────────────────────────────────
@@ -123,228 +155,161 @@ class CheckSignals(QObject):
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-#  Loading Screen
+#  Integrity checks (worker object, lives on a QThread)
 # ─────────────────────────────────────────────────────────────────────────────
-class LoadingScreen(QMainWindow):
+class CheckWorker(QObject):
+    finished = pyqtSignal()
 
-    def __init__(self, root: Path, python: str, settings: dict):
+    def __init__(self, root: Path, python: str, sig: CheckSignals):
         super().__init__()
-        self.root     = root
-        self.python   = python
-        self.settings = settings
-
-        self.setWindowTitle("Apollova")
-        self.setFixedSize(460, 540)
-        self.setWindowFlags(
-            Qt.WindowType.Window |
-            Qt.WindowType.CustomizeWindowHint |
-            Qt.WindowType.WindowTitleHint)
-
-        screen = QApplication.primaryScreen().geometry()
-        self.move((screen.width() - 460) // 2,
-                  (screen.height() - 540) // 2)
-
-        icon = root / "assets" / "icon.ico"
-        if not icon.exists():
-            icon = root / "icon.ico"
-        if icon.exists():
-            self.setWindowIcon(QIcon(str(icon)))
-
-        log.session_start("Apollova")
-        log.info(f"Install root: {root}")
-        log.info(f"Python: {python}")
+        self.root   = root
+        self.python = python
+        self.sig    = sig
         self._abort = False
-        self.sig = CheckSignals()
-        self.sig.item.connect(self._add_item)
-        self.sig.progress.connect(self._set_progress)
-        self.sig.done.connect(self._on_checks_passed)
-        self.sig.fatal.connect(self._on_fatal)
-
-        # Smooth bar animation
-        self._bar_val  = 0
-        self._bar_tgt  = 0
-        self._anim     = QTimer(self)
-        self._anim.setInterval(30)
-        self._anim.timeout.connect(self._animate)
-        self._anim.start()
-
-        self._build_ui()
-        threading.Thread(target=self._run_checks, daemon=True).start()
-
-    # ─────────────────────────────────────────────────────────────────────────
-    #  UI
-    # ─────────────────────────────────────────────────────────────────────────
-    def _build_ui(self):
-        central = QWidget()
-        self.setCentralWidget(central)
-        layout = QVBoxLayout(central)
-        layout.setContentsMargins(30, 28, 30, 20)
-        layout.setSpacing(8)
-
-        # Logo / title
-        t = QLabel("Apollova")
-        f = QFont("Segoe UI")
-        f.setPointSize(22)
-        f.setWeight(QFont.Weight.Bold)
-        t.setFont(f)
-        t.setStyleSheet("color:#89b4fa;")
-        t.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(t)
-
-        sub = QLabel("Verifying installation...")
-        sub.setStyleSheet("color:#6c7086; font-size:12px;")
-        sub.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(sub)
-
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setRange(0, 1000)
-        self.progress_bar.setValue(0)
-        self.progress_bar.setTextVisible(False)
-        layout.addWidget(self.progress_bar)
-
-        sep = QFrame()
-        sep.setFrameShape(QFrame.Shape.HLine)
-        sep.setStyleSheet("color:#313244; margin: 4px 0;")
-        layout.addWidget(sep)
-
-        # Check items container
-        self.checks_layout = QVBoxLayout()
-        self.checks_layout.setSpacing(3)
-        layout.addLayout(self.checks_layout)
-
-        layout.addStretch()
-
-        self.status_lbl = QLabel("Starting checks...")
-        self.status_lbl.setStyleSheet("color:#6c7086; font-size:11px;")
-        self.status_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(self.status_lbl)
-
-    def _add_item(self, label: str, passed: bool):
-        icon  = "✓" if passed else "⚠"
-        color = "#a6e3a1" if passed else "#f9e2af"
-        lbl   = QLabel(f"  {icon}  {label}")
-        lbl.setStyleSheet(f"color:{color}; font-size:12px;")
-        self.checks_layout.addWidget(lbl)
-        self.status_lbl.setText(label)
-
-    def _set_progress(self, pct: int):
-        self._bar_tgt = pct * 10
-
-    def _animate(self):
-        if self._bar_val < self._bar_tgt:
-            diff = self._bar_tgt - self._bar_val
-            self._bar_val += max(1, int(diff * 0.08))
-            self._bar_val = min(self._bar_tgt, self._bar_val)
-            self.progress_bar.setValue(self._bar_val)
-
-    def _on_checks_passed(self):
-        log.info("All integrity checks passed — launching app")
-        self._bar_tgt = 1000
-        self.status_lbl.setText("Launching Apollova...")
-        QTimer.singleShot(600, self._launch_app)
-
-    def _on_fatal(self, title: str, body: str, fix: str):
-        log.error(f"FATAL: {title}\n  {body}")
-        log.session_end("Apollova", success=False)
-        self._anim.stop()
-        self.progress_bar.setStyleSheet(
-            "QProgressBar::chunk { background:#f38ba8; border-radius:4px; }")
+        self._stat_cache: dict[str, os.stat_result | None] = {}
 
-        dlg = QMessageBox(self)
-        dlg.setWindowTitle(f"Apollova — {title}")
-        dlg.setIcon(QMessageBox.Icon.Critical)
-        dlg.setText(f"<b>{title}</b>")
-        msg = body
-        if fix:
-            msg += f"\n\nHow to fix:\n{fix}"
-        dlg.setInformativeText(msg)
-        dlg.setStandardButtons(QMessageBox.StandardButton.Ok)
-        dlg.exec()
-        sys.exit(1)
+    def _stat(self, path: Path):
+        """Memoized os.stat — None if the path does not exist."""
+        key = str(path)
+        if key not in self._stat_cache:
+            try:
+                self._stat_cache[key] = os.stat(key)
+            except OSError:
+                self._stat_cache[key] = None
+        return self._stat_cache[key]
 
-    # ─────────────────────────────────────────────────────────────────────────
-    #  Integrity checks (background thread)
-    # ─────────────────────────────────────────────────────────────────────────
-    def _checks_cache_valid(self):
-        """Return True if checks passed < 24h ago (skip full re-check)."""
+    def run(self):
+        try:
+            self._run_checks()
+        finally:
+            self.finished.emit()
+
+    def _load_checks_cache(self) -> dict:
+        """Return the per-check entries from last_check.json ({} if none)."""
+        data = _read_json(self.root / "assets" / "logs" / "last_check.json")
+        if isinstance(data, dict) and isinstance(data.get("checks"), dict):
+            return data["checks"]
+        return {}
+
+    def _save_checks_cache(self, checks: dict):
         try:
             cache = self.root / "assets" / "logs" / "last_check.json"
-            if cache.exists():
-                data = json.loads(cache.read_text())
-                last = datetime.fromisoformat(data.get("timestamp", ""))
-                age_h = (datetime.now() - last).total_seconds() / 3600
-                if age_h < 24 and data.get("passed"):
-                    return True
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache, "wb") as f:
+                f.write(json.dumps({
+                    "timestamp": datetime.now().isoformat(),
+                    "checks": checks,
+                }).encode())
         except Exception:
             pass
-        return False
 
-    def _save_checks_cache(self, passed: bool):
+    def _python_fingerprint(self):
+        """Interpreter path + mtime — changes whenever Python is reinstalled."""
+        exe = shutil.which(self.python) or self.python
         try:
-            cache = self.root / "assets" / "logs" / "last_check.json"
-            cache.parent.mkdir(parents=True, exist_ok=True)
-            cache.write_text(json.dumps({
-                "timestamp": datetime.now().isoformat(),
-                "passed": passed,
-            }))
+            return (exe, os.stat(exe).st_mtime)
+        except OSError:
+            return (exe, None)
+
+    def _check_key(self, name: str) -> str:
+        """Hash of everything a check depends on; a new key forces a re-run."""
+        py = self._python_fingerprint()
+        inputs = {
+            "python":   py,
+            "files":    (str(self.root), sorted(REQUIRED_FILES)),
+            "dirs":     (str(self.root), sorted(REQUIRED_DIRS)),
+            "packages": (py, REQUIRED_PACKAGES),
+            "torch":    py,
+            "numpy":    py,
+            "ffmpeg":   (os.environ.get("PATH", ""),
+                         self._stat(self.root / "assets" / "ffmpeg.exe")
+                         is not None),
+            "writable": str(self.root),
+        }[name]
+        return hashlib.sha1(repr(inputs).encode()).hexdigest()
+
+    @staticmethod
+    def _cache_entry_fresh(entry, key: str) -> bool:
+        """True if a cached check passed < 24h ago with the same inputs."""
+        try:
+            if entry.get("key") != key:
+                return False
+            last = datetime.fromisoformat(entry.get("ts", ""))
+            age_h = (datetime.now() - last).total_seconds() / 3600
+            return age_h < 24
         except Exception:
-            pass
+            return False
 
     def _run_checks(self):
-        # Fast path: skip full checks if they passed recently
-        if self._checks_cache_valid():
-            log.info("Integrity checks passed <24h ago — skipping")
-            self.sig.item.emit("Checks cached (passed recently)", True)
-            self.sig.progress.emit(100)
-            self.sig.done.emit()
-            return
-
+        self._stat_cache.clear()
         checks = [
-            ("Python version",      self._check_python),
-            ("Required files",      self._check_files),
-            ("Required folders",    self._check_dirs),
-            ("Python packages",     self._check_packages),
-            ("PyTorch",             self._check_torch),
-            ("NumPy compatibility", self._check_numpy),
-            ("FFmpeg",              self._check_ffmpeg),
-            ("Write permissions",   self._check_writable),
+            ("python",   "Python version",      self._check_python),
+            ("files",    "Required files",      self._check_files),
+            ("dirs",     "Required folders",    self._check_dirs),
+            ("packages", "Python packages",     self._check_packages),
+            ("torch",    "PyTorch",             self._check_torch),
+            ("numpy",    "NumPy compatibility", self._check_numpy),
+            ("ffmpeg",   "FFmpeg",              self._check_ffmpeg),
+            ("writable", "Write permissions",   self._check_writable),
         ]
         total = len(checks)
         warnings = []
 
-        for i, (label, fn) in enumerate(checks):
+        # Only checks whose inputs changed (or that are >24h old) are re-run
+        cached = self._load_checks_cache()
+        fresh  = {}
+
+        for i, (name, label, fn) in enumerate(checks):
+            # A fatal check already reported: don't start the next (slow) one
+            if self._abort:
+                break
             pct = int((i / total) * 90)
             self.sig.progress.emit(pct)
+            key = self._check_key(name)
+            entry = cached.get(name)
+            if isinstance(entry, dict) and self._cache_entry_fresh(entry, key):
+                log.info(f"Check '{label}' passed <24h ago — skipping")
+                self.sig.item.emit(f"{label}  —  cached", True)
+                fresh[name] = entry
+                continue
             try:
                 ok, msg = fn()
                 log.check(label, ok, msg or "")
                 self.sig.item.emit(
                     f"{label}{'  —  ' + msg if msg else ''}",
                     ok)
-                if not ok:
+                if ok:
+                    fresh[name] = {"ts": datetime.now().isoformat(),
+                                   "key": key}
+                else:
                     warnings.append((label, msg))
             except Exception as e:
                 log.exception(f"Check '{label}' raised exception: {e}")
                 self.sig.item.emit(f"{label}  —  error: {e}", False)
                 warnings.append((label, str(e)))
-            time.sleep(0.05)
 
         self.sig.progress.emit(100)
+        self._save_checks_cache(fresh)
         if self._abort:
-            self._save_checks_cache(False)
             return
-        self._save_checks_cache(True)
         self.sig.done.emit()
 
     def _check_python(self):
-        flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+        if _is_running_python(self.python):
+            v = sys.version_info
+            ver = f"{v.major}.{v.minor}.{v.micro}"
+            if v.major == 3 and v.minor == 11:
+                return True, f"Python {ver}"
+            return False, (
+                f"Python {ver} found but 3.11.x is required. "
+                "Re-run Setup.exe.")
         try:
             r = subprocess.run(
                 [self.python, "-c",
                  "import sys; v=sys.version_info; "
                  "print(v.major, v.minor, v.micro)"],
-                capture_output=True, text=True,
-                timeout=5, creationflags=flags)
+                capture_output=True,
+                timeout=5, creationflags=_CF, startupinfo=_SI)
             if r.returncode == 0:
                 parts = r.stdout.strip().split()
                 if len(parts) >= 3:
@@ -363,7 +328,7 @@ class LoadingScreen(QMainWindow):
     def _check_files(self):
         missing = []
         for rel in REQUIRED_FILES:
-            if not (self.root / rel).exists():
+            if self._stat(self.root / rel) is None:
                 missing.append(rel)
         if missing:
             self._abort = True
@@ -380,15 +345,15 @@ class LoadingScreen(QMainWindow):
         created = []
         for rel in REQUIRED_DIRS:
             d = self.root / rel
-            if not d.exists():
+            if self._stat(d) is None:
                 d.mkdir(parents=True, exist_ok=True)
+                self._stat_cache.pop(str(d), None)
                 created.append(rel)
         if created:
             return True, f"Created {len(created)} missing folder(s)"
         return True, "All folders present"
 
     def _check_packages(self):
-        flags    = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
         to_check = [
             (imp, name)
             for imp, name, _ in REQUIRED_PACKAGES
@@ -410,8 +375,8 @@ class LoadingScreen(QMainWindow):
 
         r = subprocess.run(
             [self.python, "-c", "\n".join(lines)],
-            capture_output=True, text=True,
-            timeout=30, creationflags=flags)
+            capture_output=True,
+            timeout=30, creationflags=_CF, startupinfo=_SI)
 
         failed = []
         if r.returncode == 0:
@@ -437,19 +402,18 @@ class LoadingScreen(QMainWindow):
         return True, f"{len(to_check)} packages OK"
 
     def _check_torch(self):
-        flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
         r = subprocess.run(
             [self.python, "-c",
              "import warnings; warnings.filterwarnings('ignore'); "
              "import torch; torch.tensor([1.0]); print('ok')"],
-            capture_output=True, text=True,
-            timeout=20, creationflags=flags)
+            capture_output=True,
+            timeout=20, creationflags=_CF, startupinfo=_SI)
 
-        if r.returncode == 0 and "ok" in r.stdout:
+        if r.returncode == 0 and b"ok" in r.stdout:
             return True, "PyTorch working"
 
         err = (r.stderr + r.stdout).lower()
-        if "1114" in err or "dll" in err or "c10" in err:
+        if b"1114" in err or b"dll" in err or b"c10" in err:
             self._abort = True
             self.sig.fatal.emit(
                 "PyTorch DLL Error",
@@ -459,7 +423,7 @@ class LoadingScreen(QMainWindow):
                 "You may also need to install Visual C++ Redistributable:\n"
                 "https://aka.ms/vs/17/release/vc_redist.x64.exe"
             )
-        elif "numpy" in err:
+        elif b"numpy" in err:
             self._abort = True
             self.sig.fatal.emit(
                 "NumPy Conflict",
@@ -470,21 +434,21 @@ class LoadingScreen(QMainWindow):
             self._abort = True
             self.sig.fatal.emit(
                 "PyTorch Not Working",
-                f"PyTorch failed to load:\n\n{r.stderr[:400]}",
+                "PyTorch failed to load:\n\n"
+                f"{r.stderr[:400].decode('utf-8', 'replace')}",
                 "Re-run Setup.exe to repair your installation.\n\n"
                 f"If this continues, contact {SUPPORT_EMAIL}"
             )
         return False, "PyTorch failed"
 
     def _check_numpy(self):
-        flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
         r = subprocess.run(
             [self.python, "-c",
              "import numpy; print(numpy.__version__)"],
-            capture_output=True, text=True,
-            timeout=10, creationflags=flags)
+            capture_output=True,
+            timeout=10, creationflags=_CF, startupinfo=_SI)
         if r.returncode == 0:
-            ver = r.stdout.strip()
+            ver = r.stdout.strip().decode("ascii", "replace")
             major = int(ver.split(".")[0])
             if major >= 2:
                 return False, (
@@ -495,11 +459,11 @@ class LoadingScreen(QMainWindow):
 
     def _check_ffmpeg(self):
         # Check PATH
-        flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
         try:
             r = subprocess.run(
                 ["ffmpeg", "-version"],
-                capture_output=True, timeout=5, creationflags=flags)
+                capture_output=True, timeout=5,
+                creationflags=_CF, startupinfo=_SI)
             if r.returncode == 0:
                 return True, "FFmpeg in PATH"
         except Exception:
@@ -507,7 +471,7 @@ class LoadingScreen(QMainWindow):
 
         # Check app folder
         app_ffmpeg = self.root / "assets" / "ffmpeg.exe"
-        if app_ffmpeg.exists():
+        if self._stat(app_ffmpeg) is not None:
             return True, "FFmpeg in assets folder"
 
         # Not fatal — warn only
@@ -521,7 +485,9 @@ class LoadingScreen(QMainWindow):
             self.root / "Apollova-Aurora" / "jobs",
         ]
         for d in test_dirs:
-            d.mkdir(parents=True, exist_ok=True)
+            if self._stat(d) is None:
+                d.mkdir(parents=True, exist_ok=True)
+                self._stat_cache.pop(str(d), None)
             test_file = d / ".write_test"
             try:
                 test_file.write_text("test")
@@ -530,15 +496,171 @@ class LoadingScreen(QMainWindow):
                 return False, f"Cannot write to {d.name}: {e}"
         return True, "Folders writable"
 
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  Loading Screen
+# ─────────────────────────────────────────────────────────────────────────────
+class LoadingScreen(QMainWindow):
+
+    def __init__(self, root: Path, python: str, settings: dict):
+        super().__init__()
+        self.root     = root
+        self.python   = python
+        self.settings = settings
+        self._env     = os.environ.copy()
+
+        self.setWindowTitle("Apollova")
+        self.setFixedSize(460, 540)
+        self.setWindowFlags(
+            Qt.WindowType.Window |
+            Qt.WindowType.CustomizeWindowHint |
+            Qt.WindowType.WindowTitleHint)
+
+        screen = QApplication.primaryScreen().geometry()
+        self.move((screen.width() - 460) // 2,
+                  (screen.height() - 540) // 2)
+
+        icon = root / "assets" / "icon.ico"
+        if not icon.exists():
+            icon = root / "icon.ico"
+        if icon.exists():
+            self.setWindowIcon(QIcon(str(icon)))
+
+        log.session_start("Apollova")
+        log.info(f"Install root: {root}")
+        log.info(f"Python: {python}")
+        self.sig = CheckSignals()
+        self.sig.item.connect(self._add_item)
+        self.sig.progress.connect(self._set_progress)
+        self.sig.done.connect(self._on_checks_passed)
+        self.sig.fatal.connect(self._on_fatal)
+
+        # Smooth bar animation
+        self._bar_val  = 0
+        self._bar_tgt  = 0
+        self._anim     = QTimer(self)
+        self._anim.setInterval(30)
+        self._anim.timeout.connect(self._animate)
+        self._anim.start()
+
+        self._build_ui()
+
+        self._thread = QThread(self)
+        self._worker = CheckWorker(root, python, self.sig)
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.run)
+        self._worker.finished.connect(self._thread.quit)
+        self._thread.start()
+
+    # ─────────────────────────────────────────────────────────────────────────
+    #  UI
+    # ─────────────────────────────────────────────────────────────────────────
+    def _build_ui(self):
+        central = QWidget()
+        self.setCentralWidget(central)
+        layout = QVBoxLayout(central)
+        layout.setContentsMargins(30, 28, 30, 20)
+        layout.setSpacing(8)
+
+        # Logo / title
+        t = QLabel("Apollova")
+        f = QFont("Segoe UI")
+        f.setPointSize(22)
+        f.setWeight(QFont.Weight.Bold)
+        t.setFont(f)
+        t.setStyleSheet("color:#89b4fa;")
+        t.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(t)
+
+        sub = QLabel("Verifying installation...")
+        sub.setStyleSheet("color:#6c7086; font-size:12px;")
+        sub.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(sub)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setTextVisible(False)
+        layout.addWidget(self.progress_bar)
+
+        sep = QFrame()
+        sep.setFrameShape(QFrame.Shape.HLine)
+        sep.setStyleSheet("color:#313244; margin: 4px 0;")
+        layout.addWidget(sep)
+
+        # Check items — one rich-text label, re-rendered as items arrive
+        self._items = []
+        self.checks_lbl = QLabel()
+        self.checks_lbl.setTextFormat(Qt.TextFormat.RichText)
+        self.checks_lbl.setWordWrap(True)
+        self.checks_lbl.setStyleSheet("font-size:12px;")
+        layout.addWidget(self.checks_lbl)
+
+        layout.addStretch()
+
+        self.status_lbl = QLabel("Starting checks...")
+        self.status_lbl.setStyleSheet("color:#6c7086; font-size:11px;")
+        self.status_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.status_lbl)
+
+    def _add_item(self, label: str, passed: bool):
+        icon  = "✓" if passed else "⚠"
+        color = "#a6e3a1" if passed else "#f9e2af"
+        self._items.append(
+            f"<span style='color:{color};'>&nbsp;&nbsp;{icon}&nbsp;&nbsp;"
+            f"{html.escape(label)}</span>")
+        # Line spacing lives in the HTML: QSS has no line-height property
+        self.checks_lbl.setText(
+            "<div style='line-height:140%;'>" + "<br>".join(self._items) + "</div>")
+        self.status_lbl.setText(label)
+
+    def _set_progress(self, pct: int):
+        self._bar_tgt = pct * 10
+
+    def _animate(self):
+        if self._bar_val < self._bar_tgt:
+            diff = self._bar_tgt - self._bar_val
+            self._bar_val += max(1, int(diff * 0.08))
+            self._bar_val = min(self._bar_tgt, self._bar_val)
+            self.progress_bar.setValue(self._bar_val)
+
+    def _on_checks_passed(self):
+        log.info("All integrity checks passed — launching app")
+        self._bar_tgt = 1000
+        self.status_lbl.setText("Launching Apollova...")
+        QTimer.singleShot(600, self._launch_app)
+
+    def _on_fatal(self, title: str, body: str, fix: str):
+        log.error(f"FATAL: {title}\n  {body}")
+        log.session_end("Apollova", success=False)
+        self._anim.stop()
+        self.progress_bar.setStyleSheet(
+            "QProgressBar::chunk { background:#f38ba8; border-radius:4px; }")
+
+        dlg = QMessageBox(self)
+        dlg.setWindowTitle(f"Apollova — {title}")
+        dlg.setIcon(QMessageBox.Icon.Critical)
+        dlg.setText(f"<b>{title}</b>")
+        msg = body
+        if fix:
+            msg += f"\n\nHow to fix:\n{fix}"
+        dlg.setInformativeText(msg)
+        dlg.setStandardButtons(QMessageBox.StandardButton.Ok)
+        dlg.exec()
+        # The worker stops after the check in progress (it checks _abort);
+        # wait it out so Qt never destroys a running QThread on exit
+        self._thread.quit()
+        self._thread.wait()
+        sys.exit(1)
+
     # ─────────────────────────────────────────────────────────────────────────
     #  Launch main app
     # ─────────────────────────────────────────────────────────────────────────
     def _launch_app(self):
         gui = self.root / "assets" / "apollova_gui.py"
-        flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
 
         # Add assets/ffmpeg to PATH if applicable
-        env = os.environ.copy()
+        env = self._env
         app_ffmpeg = self.root / "assets"
         if (app_ffmpeg / "ffmpeg.exe").exists():
             env["PATH"] = str(app_ffmpeg) + os.pathsep + env.get("PATH", "")
@@ -546,10 +668,13 @@ class LoadingScreen(QMainWindow):
         try:
             os.chdir(str(self.root / "assets"))
             log.info(f"Launching: {self.python} {gui}")
+            # The GUI appends to the same app.log: write our session header
+            # and check results first so the file stays in order
+            log.flush()
             proc = subprocess.Popen(
                 [self.python, str(gui)],
                 env=env,
-                creationflags=flags)
+                creationflags=_CF)
             self.hide()
             proc.wait()
             log.info(f"App exited with code {proc.returncode}")
@@ -575,15 +700,16 @@ class LoadingScreen(QMainWindow):
 #  Bootstrap — resolve paths, load settings, find Python
 # ─────────────────────────────────────────────────────────────────────────────
 def _find_python(root: Path, settings: dict) -> str | None:
-    flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
 
     def valid(path):
+        if _is_running_python(path):
+            return sys.version_info[:2] == (3, 11)
         try:
             r = subprocess.run(
                 [path, "-c",
                  "import sys; v=sys.version_info; print(v.major, v.minor)"],
-                capture_output=True, text=True,
-                timeout=5, creationflags=flags)
+                capture_output=True,
+                timeout=5, creationflags=_CF, startupinfo=_SI)
             if r.returncode == 0:
                 parts = r.stdout.strip().split()
                 return (len(parts) == 2 and
@@ -639,13 +765,9 @@ def main():
         root = Path(__file__).parent
 
     # Load settings
-    settings = {}
-    sf = root / "settings.json"
-    if sf.exists():
-        try:
-            settings = json.loads(sf.read_text())
-        except Exception:
-            pass
+    settings = _read_json(root / "settings.json")
+    if not isinstance(settings, dict):
+        settings = {}
 
     # Check assets folder exists at all
     if not (root / "assets").exists():
@@ -4,15 +4,20 @@ Apollova License Activation Dialog
 Shown on startup when no valid license is found.
 """
 
+import os
+import sys
+import time
+import types
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QFrame,
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import (
+    Qt, QTimer, QThread, QObject, QRegularExpression, pyqtSignal,
+)
 from PyQt6.QtGui import QFont
 
-from apollova_license import activate_license
-
 _STYLE = """
 QDialog, QWidget {
     background-color: #1e1e2e;
@@ -47,9 +52,31 @@ QPushButton#primary {
 }
 QPushButton#primary:hover { background: #b4befe; }
 QPushButton#primary:disabled { background: #45475a; color: #6c7086; }
+QLabel#status { color: #f38ba8; font-size: 12px; }
+QLabel#status[state="ok"]   { color: #a6e3a1; }
+QLabel#status[state="busy"] { color: #89b4fa; }
 """
 
-_MESSAGES = {
+# How long the success message stays up before the dialog closes
+# (APOLLOVA_SUCCESS_DELAY_MS overrides; a malformed value is ignored, since
+# this runs at import and the launcher only guards against ImportError)
+try:
+    _SUCCESS_DELAY_MS = int(os.environ.get("APOLLOVA_SUCCESS_DELAY_MS", "250"))
+except ValueError:
+    _SUCCESS_DELAY_MS = 250
+
+# Title font — built on first use (a QFont needs the QApplication to exist)
+_TITLE_FONT = None
+
+
+def _title_font() -> QFont:
+    global _TITLE_FONT
+    if _TITLE_FONT is None:
+        _TITLE_FONT = QFont("Segoe UI", 20, QFont.Weight.Bold)
+    return _TITLE_FONT
+
+
+_MESSAGES = types.MappingProxyType({sys.intern(k): v for k, v in {
     "no_license": "Enter your Apollova license key to activate this software.",
     "hardware_mismatch": (
         "This license file belongs to a different computer.\n"
@@ -63,10 +90,32 @@ _MESSAGES = {
         "Your license has been revoked.\n"
         "Please contact support@apollova.co.uk for assistance."
     ),
-}
+}.items()})
+
+# Full key shape, compiled once; malformed keys never reach the server
+_KEY_RE = QRegularExpression(r"^[A-Z0-9]{4}(-[A-Z0-9]{4}){3}$")
+_KEY_RE.optimize()
+
+# Strips separators / stray ASCII punctuation to detect an empty field
+_DELETE_TABLE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not chr(c).isalnum()))
+
+
+class _ActivateWorker(QObject):
+    """Runs activate_license() off the GUI thread; one per dialog."""
+    result = pyqtSignal(bool, str)   # success, message
+
+    def activate(self, key: str):
+        try:
+            from apollova_license import activate_license
+            success, message = activate_license(key)
+        except Exception as e:
+            success, message = False, f"Unexpected error: {e}"
+        self.result.emit(success, message)
 
 
 class ActivationDialog(QDialog):
+    _request = pyqtSignal(str)       # key — queued to the worker thread
 
     def __init__(self, reason: str = "no_license", parent=None):
         super().__init__(parent)
@@ -80,22 +129,34 @@ class ActivationDialog(QDialog):
         )
         self.setStyleSheet(_STYLE)
         self._activated = False
-        self._build_ui(reason)
+        self._thread = None
+        self._worker = None
+        self._in_flight = False          # one activation request at a time
+        self._last_click_mono = 0.0
+        self._close_timer = QTimer(self)
+        self._close_timer.setSingleShot(True)
+        self._close_timer.timeout.connect(self.accept)
+        self._key_input = None
+        self._activate_btn = None
+        self._exit_btn = None
+        if reason == "revoked":
+            # Must contact support — no key input, no network path at all
+            self._build_revoked_ui()
+        else:
+            self._build_ui(reason)
 
     # ─────────────────────────────────────────────────────────────────────────
     #  UI
     # ─────────────────────────────────────────────────────────────────────────
-    def _build_ui(self, reason: str):
+    def _build_header(self, reason: str) -> QVBoxLayout:
+        """Title, subtitle and reason message shared by both dialog variants."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(36, 28, 36, 24)
         layout.setSpacing(10)
 
         # Title
         title = QLabel("Apollova")
-        f = QFont("Segoe UI")
-        f.setPointSize(20)
-        f.setWeight(QFont.Weight.Bold)
-        title.setFont(f)
+        title.setFont(_title_font())
         title.setStyleSheet("color: #89b4fa;")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
@@ -111,12 +172,35 @@ class ActivationDialog(QDialog):
         layout.addWidget(sep)
 
         # Reason message
-        msg = _MESSAGES.get(reason, _MESSAGES["no_license"])
+        msg = _MESSAGES.get(sys.intern(reason), _MESSAGES["no_license"])
         reason_lbl = QLabel(msg)
         reason_lbl.setWordWrap(True)
         reason_lbl.setStyleSheet("color: #cdd6f4; font-size: 12px;")
         reason_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(reason_lbl)
+        return layout
+
+    def _build_revoked_ui(self):
+        layout = self._build_header("revoked")
+        layout.addStretch()
+
+        exit_btn = QPushButton("Exit")
+        exit_btn.setObjectName("primary")
+        exit_btn.setDefault(True)
+        exit_btn.clicked.connect(self.reject)
+        layout.addWidget(exit_btn)
+
+        link = QLabel(
+            '<a href="mailto:support@apollova.co.uk" style="color:#89b4fa;">'
+            'Contact support@apollova.co.uk</a>'
+        )
+        link.setOpenExternalLinks(True)
+        link.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        link.setStyleSheet("font-size: 11px; margin-top: 4px;")
+        layout.addWidget(link)
+
+    def _build_ui(self, reason: str):
+        layout = self._build_header(reason)
 
         # Key input
         key_lbl = QLabel("License Key")
@@ -124,16 +208,16 @@ class ActivationDialog(QDialog):
         layout.addWidget(key_lbl)
 
         self._key_input = QLineEdit()
-        self._key_input.setPlaceholderText("XXXX-XXXX-XXXX-XXXX")
-        self._key_input.setMaxLength(19)
-        self._key_input.textChanged.connect(self._auto_format)
+        # Qt enforces XXXX-XXXX-XXXX-XXXX (alnum, upper-cased) in C++
+        self._key_input.setInputMask(">NNNN-NNNN-NNNN-NNNN;_")
         layout.addWidget(self._key_input)
 
         # Status label
         self._status_lbl = QLabel("")
+        self._status_lbl.setObjectName("status")
+        self._status_lbl.setProperty("state", "err")
         self._status_lbl.setWordWrap(True)
         self._status_lbl.setMinimumHeight(38)
-        self._status_lbl.setStyleSheet("color: #f38ba8; font-size: 12px;")
         self._status_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self._status_lbl)
 
@@ -143,9 +227,9 @@ class ActivationDialog(QDialog):
         btn_row = QHBoxLayout()
         btn_row.setSpacing(10)
 
-        exit_btn = QPushButton("Exit")
-        exit_btn.clicked.connect(self.reject)
-        btn_row.addWidget(exit_btn)
+        self._exit_btn = QPushButton("Exit")
+        self._exit_btn.clicked.connect(self.reject)
+        btn_row.addWidget(self._exit_btn)
 
         self._activate_btn = QPushButton("Activate")
         self._activate_btn.setObjectName("primary")
@@ -165,48 +249,82 @@ class ActivationDialog(QDialog):
         link.setStyleSheet("font-size: 11px; margin-top: 4px;")
         layout.addWidget(link)
 
-        # Disable input for revoked licenses (must contact support)
-        if reason == "revoked":
-            self._key_input.setEnabled(False)
-            self._activate_btn.setEnabled(False)
-
     # ─────────────────────────────────────────────────────────────────────────
     #  Logic
     # ─────────────────────────────────────────────────────────────────────────
-    def _auto_format(self, text: str):
-        """Auto-insert dashes: XXXX-XXXX-XXXX-XXXX"""
-        self._key_input.blockSignals(True)
-        clean = "".join(c for c in text.upper() if c.isalnum())[:16]
-        parts = [clean[i:i + 4] for i in range(0, len(clean), 4)]
-        formatted = "-".join(parts)
-        self._key_input.setText(formatted)
-        self._key_input.setCursorPosition(len(formatted))
-        self._key_input.blockSignals(False)
+    def _set_status(self, state: str, text: str):
+        """Switch the status colour via the `state` QSS property (ok/err/busy)."""
+        if self._status_lbl.property("state") != state:
+            self._status_lbl.setProperty("state", state)
+            style = self._status_lbl.style()
+            style.unpolish(self._status_lbl)
+            style.polish(self._status_lbl)
+        self._status_lbl.setText(text)
 
     def _on_activate(self):
-        key = self._key_input.text().strip()
-        if not key:
-            self._status_lbl.setText("Please enter your license key.")
+        # Ignore repeat clicks / Enter presses while a request is pending
+        now = time.monotonic()
+        if self._in_flight or now - self._last_click_mono < 1.0:
+            return
+
+        key = self._key_input.text().strip().upper()
+        if not key.translate(_DELETE_TABLE):
+            self._set_status("err", "Please enter your license key.")
+            return
+        if not _KEY_RE.match(key).hasMatch():
+            self._set_status(
+                "err", "Key format invalid. Expected: XXXX-XXXX-XXXX-XXXX")
             return
+        # Stamped only for a real submit, so a corrected typo isn't swallowed
+        self._last_click_mono = now
+        self._in_flight = True
+        self._key_input.setEnabled(False)
         self._activate_btn.setEnabled(False)
+        self._exit_btn.setEnabled(False)
         self._activate_btn.setText("Activating...")
-        self._status_lbl.setStyleSheet("color: #89b4fa; font-size: 12px;")
-        self._status_lbl.setText("Contacting activation server...")
-        # Short delay so the UI repaints before the blocking network call
-        QTimer.singleShot(50, lambda: self._do_activate(key))
+        self._set_status("busy", "Contacting activation server...")
 
-    def _do_activate(self, key: str):
-        success, message = activate_license(key)
+        # Network call runs on the worker thread so the dialog keeps repainting
+        self._ensure_worker()
+        self._request.emit(key)
+
+    def _ensure_worker(self):
+        """Start the activation thread once and keep it for retries."""
+        if self._thread is not None:
+            return
+        self._thread = QThread(self)
+        self._worker = _ActivateWorker()
+        self._worker.moveToThread(self._thread)
+        self._request.connect(self._worker.activate)
+        self._worker.result.connect(self._do_activate_done)
+        self._thread.finished.connect(self._worker.deleteLater)
+        self._thread.start()
+
+    def _do_activate_done(self, success: bool, message: str):
+        self._in_flight = False
         if success:
-            self._status_lbl.setStyleSheet("color: #a6e3a1; font-size: 12px;")
-            self._status_lbl.setText(f"✓  {message}")
+            self._set_status("ok", f"✓  {message}")
             self._activated = True
-            QTimer.singleShot(900, self.accept)
+            self._close_timer.start(_SUCCESS_DELAY_MS)
         else:
-            self._status_lbl.setStyleSheet("color: #f38ba8; font-size: 12px;")
-            self._status_lbl.setText(message)
+            self._set_status("err", message)
+            self._key_input.setEnabled(True)
             self._activate_btn.setEnabled(True)
+            self._exit_btn.setEnabled(True)
             self._activate_btn.setText("Activate")
 
+    def done(self, result: int):
+        # Exit is disabled while activating; this also swallows Esc and the
+        # title-bar close (QDialog ignores the close event if still visible)
+        if self._in_flight:
+            return
+        self._close_timer.stop()
+        if self._thread is not None:
+            # Idle worker: quit returns at once, so wait without a timeout
+            self._worker.result.disconnect(self._do_activate_done)
+            self._thread.quit()
+            self._thread.wait()
+        super().done(result)
+
     def was_activated(self) -> bool:
         return self._activated
@@ -8,24 +8,38 @@ import os
 import re
 import sys
 import json
+import logging
+import functools
+import hashlib
+import importlib
 import shutil
 import time
 import threading
 import tempfile
 import traceback
 import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait as futures_wait
+from types import MappingProxyType
 from pathlib import Path
 from datetime import datetime
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QComboBox, QRadioButton,
-    QTabWidget, QGroupBox, QTextEdit, QProgressBar, QListWidget,
+    QTabWidget, QGroupBox, QPlainTextEdit, QProgressBar, QListWidget,
     QScrollArea, QFileDialog, QMessageBox, QButtonGroup, QFrame,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QObject
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QObject, QTimer, QRunnable, QThreadPool, QFileSystemWatcher,
+)
 from PyQt6.QtGui import QFont, QIcon
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ── Path resolution ───────────────────────────────────────────────────────────
 if getattr(sys, "frozen", False):
     BASE_DIR   = Path(sys.executable).parent
@@ -43,8 +57,19 @@ except Exception:
     _get_logger = None
 
 # ── Safe startup: friendly GUI errors instead of raw tracebacks ───────────────
+_ERR_QSS = (
+    "QWidget{background:#1e1e2e;color:#cdd6f4;font-family:'Segoe UI';font-size:13px;}"
+    "QPushButton{background:#313244;border:1px solid #45475a;border-radius:5px;"
+    "padding:6px 16px;color:#cdd6f4;}"
+    "QPushButton:hover{background:#89b4fa;color:#1e1e2e;}"
+)
+
+def _err_app():
+    app = QApplication.instance()
+    return app if app is not None else QApplication(sys.argv)
+
 def _show_startup_error(title, message, fix=None):
-    app = QApplication.instance() or QApplication(sys.argv)
+    app = _err_app()
     dlg = QMessageBox()
     dlg.setWindowTitle(f"Apollova \u2014 {title}")
     dlg.setIcon(QMessageBox.Icon.Critical)
@@ -54,55 +79,16 @@ def _show_startup_error(title, message, fix=None):
         full_msg += f"\n\n<b>How to fix:</b>\n{fix}"
     dlg.setInformativeText(full_msg)
     dlg.setStandardButtons(QMessageBox.StandardButton.Ok)
-    dlg.setStyleSheet(
-        "QWidget{background:#1e1e2e;color:#cdd6f4;font-family:'Segoe UI';font-size:13px;}"
-        "QPushButton{background:#313244;border:1px solid #45475a;border-radius:5px;"
-        "padding:6px 16px;color:#cdd6f4;}"
-        "QPushButton:hover{background:#89b4fa;color:#1e1e2e;}"
-    )
+    dlg.setStyleSheet(_ERR_QSS)
     dlg.exec()
     sys.exit(1)
 
-def _import_scripts():
-    global Config, download_audio, trim_audio, detect_beats
-    global download_image, extract_colors, transcribe_audio
-    global transcribe_audio_mono, transcribe_audio_onyx
-    global SongDatabase, fetch_genius_image, SmartSongPicker
-
-    # Check files exist
-    missing = [s for s in ["config","audio_processing","image_processing",
-                            "whisper_common",
-                            "lyric_processing","lyric_processing_mono",
-                            "lyric_processing_onyx","lyric_alignment",
-                            "song_database","genius_processing","smart_picker"]
-               if not (ASSETS_DIR / "scripts" / f"{s}.py").exists()]
-    if missing:
-        _show_startup_error(
-            "Missing Files",
-            "The following required files are missing:\n\n" +
-            "\n".join(f"  \u2022 scripts/{m}.py" for m in missing),
-            "Please reinstall Apollova \u2014 some files appear to have been deleted."
-        )
-
-    try:
-        from scripts.config import Config as _C
-        from scripts.audio_processing import download_audio as _da, trim_audio as _ta, detect_beats as _db
-        from scripts.image_processing import download_image as _di, extract_colors as _ec
-        from scripts.lyric_processing import transcribe_audio as _tr
-        from scripts.lyric_processing_mono import transcribe_audio_mono as _trm
-        from scripts.lyric_processing_onyx import transcribe_audio_onyx as _tro
-        from scripts.song_database import SongDatabase as _SD
-        from scripts.genius_processing import fetch_genius_image as _fg
-        from scripts.smart_picker import SmartSongPicker as _SP
-        Config=_C; download_audio=_da; trim_audio=_ta; detect_beats=_db
-        download_image=_di; extract_colors=_ec; transcribe_audio=_tr
-        transcribe_audio_mono=_trm; transcribe_audio_onyx=_tro
-        SongDatabase=_SD; fetch_genius_image=_fg; SmartSongPicker=_SP
-
-    except OSError as e:
+def _import_failure(e):
+    """Map an exception raised while importing scripts.* to (title, message, fix)."""
+    if isinstance(e, OSError):
         err = str(e)
         if "1114" in err or "DLL" in err or "c10.dll" in err:
-            _show_startup_error(
+            return (
                 "PyTorch DLL Error",
                 "PyTorch failed to load due to a conflicting installation.\n\n"
                 "This happens when two versions of PyTorch are installed at the same time "
@@ -113,29 +99,98 @@ def _import_scripts():
                 "If this keeps happening, install the Visual C++ Redistributable:\n"
                 "https://aka.ms/vs/17/release/vc_redist.x64.exe"
             )
-        _show_startup_error("Load Error", f"Failed to load application:\n{e}",
-                            "Re-run Setup.exe to repair your installation.")
-
-    except ImportError as e:
+        return ("Load Error", f"Failed to load application:\n{e}",
+                "Re-run Setup.exe to repair your installation.")
+    if isinstance(e, ImportError):
         pkg = str(e).replace("No module named ","").strip("'")
-        _show_startup_error(
+        return (
             "Missing Package",
             f"A required Python package is not installed:\n\n  {pkg}",
             f"Re-run Setup.exe to install all required packages.\n\n"
             f"Or manually run:  pip install {pkg}"
         )
-    except Exception as e:
-        _show_startup_error(
-            "Startup Error",
+    return ("Startup Error",
             f"Apollova failed to start:\n\n{type(e).__name__}: {e}",
-            "Re-run Setup.exe to repair your installation."
-        )
+            "Re-run Setup.exe to repair your installation.")
+
+def _import_scripts():
+    global Config, SongDatabase
+
+    # Check files exist (one directory listing instead of a stat per file).
+    # Frozen builds carry scripts.* inside the bundle, so there only the
+    # import errors below can report a missing module.
+    if not getattr(sys, "frozen", False):
+        try:
+            present = {e.name for e in os.scandir(ASSETS_DIR / "scripts")}
+        except OSError:
+            present = set()
+        missing = [s for s in ["config","audio_processing","image_processing",
+                                "whisper_common",
+                                "lyric_processing","lyric_processing_mono",
+                                "lyric_processing_onyx","lyric_alignment",
+                                "song_database","genius_processing","smart_picker"]
+                   if f"{s}.py" not in present]
+        if missing:
+            _show_startup_error(
+                "Missing Files",
+                "The following required files are missing:\n\n" +
+                "\n".join(f"  \u2022 scripts/{m}.py" for m in missing),
+                "Please reinstall Apollova \u2014 some files appear to have been deleted."
+            )
+
+    # Only what the window needs at construction; the rest loads on first use
+    try:
+        from scripts.config import Config as _C
+        from scripts.song_database import SongDatabase as _SD
+        Config=_C; SongDatabase=_SD
+    except Exception as e:
+        _show_startup_error(*_import_failure(e))
+
+# ── Lazy scripts.* callables ──────────────────────────────────────────────────
+# The processing modules pull in Whisper/PyTorch/librosa, so they are imported
+# the first time one of these names is called rather than at startup.
+_LAZY_SCRIPTS = {
+    "download_audio":        "audio_processing",
+    "download_audio_section": "audio_processing",
+    "trim_audio":            "audio_processing",
+    "detect_beats":          "audio_processing",
+    "download_image":        "image_processing",
+    "extract_colors":        "image_processing",
+    "transcribe_audio":      "lyric_processing",
+    "transcribe_audio_mono": "lyric_processing_mono",
+    "transcribe_audio_onyx": "lyric_processing_onyx",
+    "warmup_whisper":        "whisper_common",
+    "fetch_genius_image":    "genius_processing",
+    "SmartSongPicker":       "smart_picker",
+}
+
+def _load_script(name):
+    """Import the real object behind a lazy name and cache it as a global."""
+    try:
+        obj = getattr(importlib.import_module(f"scripts.{_LAZY_SCRIPTS[name]}"), name)
+    except Exception as e:
+        title, message, fix = _import_failure(e)
+        if threading.current_thread() is threading.main_thread():
+            _show_startup_error(title, message, fix)
+        # Worker thread: surface through the normal job-error popup instead
+        raise RuntimeError(f"{title}: {message}\n\n{fix}") from e
+    globals()[name] = obj
+    return obj
+
+class _LazyScript:
+    """Placeholder global for a scripts.* callable; imports it on first call."""
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
 
-Config=download_audio=trim_audio=detect_beats=None
-download_image=extract_colors=transcribe_audio=None
-transcribe_audio_mono=transcribe_audio_onyx=None
-SongDatabase=fetch_genius_image=SmartSongPicker=None
-_import_scripts()
+    def __call__(self, *args, **kwargs):
+        return _load_script(self.name)(*args, **kwargs)
+
+for _name in _LAZY_SCRIPTS:
+    globals()[_name] = _LazyScript(_name)
+
+_import_scripts()   # binds Config/SongDatabase, or exits via _show_startup_error
 
 # ── Directory constants ───────────────────────────────────────────────────────
 INSTALL_DIR     = BASE_DIR
@@ -147,191 +202,99 @@ DATABASE_DIR    = BASE_DIR / "database"
 WHISPER_DIR     = BASE_DIR / "whisper_models"
 SETTINGS_FILE   = BASE_DIR / "settings.json"
 
-TEMPLATE_PATHS = {
+TEMPLATE_PATHS = MappingProxyType({
     "aurora": TEMPLATES_DIR / "Apollova-Aurora.aep",
     "mono":   TEMPLATES_DIR / "Apollova-Mono.aep",
     "onyx":   TEMPLATES_DIR / "Apollova-Onyx.aep",
-}
-JOBS_DIRS = {
+})
+JOBS_DIRS = MappingProxyType({
     "aurora": AURORA_JOBS_DIR,
     "mono":   MONO_JOBS_DIR,
     "onyx":   ONYX_JOBS_DIR,
-}
-JSX_SCRIPTS = {
+})
+JSX_SCRIPTS = MappingProxyType({
     "aurora": "Apollova-Aurora-Injection.jsx",
     "mono":   "Apollova-Mono-Injection.jsx",
     "onyx":   "Apollova-Onyx-Injection.jsx",
-}
+})
+# Display strings for the output-path label, resolved once
+JOBS_DIR_LABELS = MappingProxyType({t: str(d) for t, d in JOBS_DIRS.items()})
+
+def _resolve_jsx():
+    try:
+        present = {e.name for e in os.scandir(BUNDLED_JSX_DIR)}
+    except OSError:
+        present = set()
+    return MappingProxyType({t: BUNDLED_JSX_DIR / j if j in present else None
+                             for t, j in JSX_SCRIPTS.items()})
+
+# Bundled injection script per template (None if missing), resolved once
+RESOLVED_JSX = _resolve_jsx()
+
+# Created on startup by _init_directories
+_DIRS = (AURORA_JOBS_DIR, MONO_JOBS_DIR, ONYX_JOBS_DIR,
+         DATABASE_DIR, WHISPER_DIR, TEMPLATES_DIR)
 
 # ── Stylesheet ────────────────────────────────────────────────────────────────
-APP_STYLE = """
-QMainWindow, QWidget {
-    background-color: #1e1e2e;
-    color: #cdd6f4;
-    font-family: 'Segoe UI';
-    font-size: 13px;
-}
-QTabWidget::pane {
-    border: 1px solid #313244;
-    border-radius: 6px;
-    background: #1e1e2e;
-}
-QTabBar::tab {
-    background: #313244;
-    color: #cdd6f4;
-    padding: 8px 18px;
-    border-radius: 4px;
-    margin-right: 3px;
-}
-QTabBar::tab:selected {
-    background: #89b4fa;
-    color: #1e1e2e;
-    font-weight: bold;
-}
-QGroupBox {
-    border: 1px solid #313244;
-    border-radius: 6px;
-    margin-top: 12px;
-    padding: 10px;
-    font-weight: bold;
-    color: #89b4fa;
-}
-QGroupBox::title {
-    subcontrol-origin: margin;
-    left: 10px;
-    padding: 0 5px;
-}
-QLineEdit {
-    background: #313244;
-    border: 1px solid #45475a;
-    border-radius: 4px;
-    padding: 6px 8px;
-    color: #cdd6f4;
-}
-QLineEdit:focus { border: 1px solid #89b4fa; }
-QPushButton {
-    background: #313244;
-    border: 1px solid #45475a;
-    border-radius: 6px;
-    padding: 7px 18px;
-    color: #cdd6f4;
-    min-height: 28px;
-}
-QPushButton:hover { background: #3a3d5c; border-color: #89b4fa; color: #cdd6f4; }
-QPushButton:pressed { background: #89b4fa; color: #1e1e2e; border-color: #89b4fa; }
-QPushButton:disabled { background: #1e1e2e; color: #45475a; border-color: #2a2a3c; }
-QPushButton#primary {
-    background: #89b4fa;
-    color: #1e1e2e;
-    font-weight: bold;
-    font-size: 14px;
-    padding: 9px 26px;
-    border: none;
-    border-radius: 6px;
-    min-height: 34px;
-}
-QPushButton#primary:hover { background: #b4befe; border: none; }
-QPushButton#primary:pressed { background: #cdd6f4; border: none; }
-QPushButton#primary:disabled { background: #2a2f45; color: #45475a; border: 1px solid #313244; }
-QPushButton#accent {
-    background: #1a2540;
-    color: #89b4fa;
-    border: 1px solid #4a6fa5;
-    border-radius: 6px;
-    padding: 7px 18px;
-    min-height: 28px;
-}
-QPushButton#accent:hover { background: #89b4fa; color: #1e1e2e; border-color: #89b4fa; }
-QPushButton#accent:pressed { background: #b4befe; color: #1e1e2e; }
-QPushButton#accent:disabled { background: #1e1e2e; color: #45475a; border-color: #2a2a3c; }
-QPushButton#danger {
-    background: #2e1520;
-    color: #f38ba8;
-    border: 1px solid #6b2d3e;
-    border-radius: 6px;
-    padding: 7px 18px;
-    min-height: 28px;
-}
-QPushButton#danger:hover { background: #f38ba8; color: #1e1e2e; border-color: #f38ba8; }
-QPushButton#danger:pressed { background: #eba0ac; color: #1e1e2e; }
-QPushButton#muted {
-    background: #1e1e2e;
-    color: #6c7086;
-    border: 1px solid #313244;
-    border-radius: 6px;
-    padding: 7px 18px;
-    min-height: 28px;
-}
-QPushButton#muted:hover { background: #313244; color: #a6adc8; border-color: #45475a; }
-QPushButton#muted:pressed { background: #45475a; color: #cdd6f4; }
-QComboBox {
-    background: #313244;
-    border: 1px solid #45475a;
-    border-radius: 4px;
-    padding: 5px 8px;
-    color: #cdd6f4;
-}
-QComboBox::drop-down { border: none; }
-QComboBox QAbstractItemView {
-    background: #313244;
-    color: #cdd6f4;
-    selection-background-color: #89b4fa;
-    selection-color: #1e1e2e;
-}
-QRadioButton { spacing: 8px; color: #cdd6f4; padding: 3px 0; }
-QRadioButton::indicator {
-    width: 16px; height: 16px;
-    border-radius: 8px;
-    border: 2px solid #45475a;
-    background: #1e1e2e;
-}
-QRadioButton::indicator:hover { border-color: #89b4fa; }
-QRadioButton::indicator:checked { background: #89b4fa; border-color: #89b4fa; }
-QTextEdit {
-    background: #11111b;
-    border: 1px solid #313244;
-    border-radius: 4px;
-    color: #a6e3a1;
-    font-family: 'Consolas';
-    font-size: 11px;
-}
-QListWidget {
-    background: #181825;
-    border: 1px solid #313244;
-    border-radius: 4px;
-    color: #cdd6f4;
-    font-family: 'Consolas';
-    font-size: 11px;
-}
-QListWidget::item:selected { background: #89b4fa; color: #1e1e2e; }
-QProgressBar {
-    background: #313244;
-    border: none;
-    border-radius: 4px;
-    height: 10px;
-    text-align: center;
-    color: #1e1e2e;
-}
-QProgressBar::chunk { background: #89b4fa; border-radius: 4px; }
-QScrollArea { border: none; }
-QScrollBar:vertical {
-    background: #1e1e2e;
-    width: 8px;
-    border-radius: 4px;
-}
-QScrollBar::handle:vertical {
-    background: #45475a;
-    border-radius: 4px;
-    min-height: 20px;
-}
-QScrollBar::handle:vertical:hover { background: #89b4fa; }
-QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }
-"""
+APP_STYLE_FILE = ASSETS_DIR / "apollova.qss"
+
+def _load_app_style():
+    """Read the app stylesheet once at startup; "" (Qt default look) if missing."""
+    try:
+        with open(APP_STYLE_FILE, "rb") as f:
+            return f.read().decode("utf-8")
+    except OSError:
+        return ""
+
 
+# Windows: keep console children (ffmpeg) from flashing a cmd window
+_POPEN_KW = {"creationflags": subprocess.CREATE_NO_WINDOW} if os.name == "nt" else {}
 
 # ── Validation patterns ───────────────────────────────────────────────────────
 _VALID_YT   = re.compile(r'(?:youtube\.com/watch\?.*v=|youtu\.be/)([A-Za-z0-9_-]{11})')
-_VALID_TIME = re.compile(r'^\d{1,2}:\d{2}$')
+_VALID_TIME = re.compile(r'^(\d{1,2}):(\d{2})$')
+
+# Separator between jobs in the generation log
+_RULE = "=" * 40
+
+# Job files are read by the injection JSX, not people: write them compact
+_JSON_SEP = (",", ":")
+
+
+def _write_json(path, obj):
+    """Compact UTF-8 JSON for lyrics/beats files; orjson when installed.
+    Returns the bytes written.
+    job_data.json stays on stdlib json — its ASCII escapes keep titles intact
+    for ExtendScript's default-encoding read."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, separators=_JSON_SEP, ensure_ascii=False).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
+    return data
+
+
+def _read_text_or(path, default):
+    """UTF-8 text of path, or default if it doesn't exist — one open(), no stat."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return default
+
+
+def _read_json(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+# What scripts.image_processing.extract_colors returns when it fails;
+# never cached as a cover's palette
+_EXTRACT_FAILED_COLORS = ['#ff5733', '#33ff57']
+
+# {{PLACEHOLDER}} tokens in the bundled injection JSX
+_JSX_SUBST_RE = re.compile(r'\{\{(JOBS_PATH|TEMPLATE_PATH|AUTO_RENDER)\}\}')
 
 # ── Worker signals (thread → UI) ──────────────────────────────────────────────
 class WorkerSignals(QObject):
@@ -342,39 +305,87 @@ class WorkerSignals(QObject):
     stats_refresh         = pyqtSignal()
     batch_progress        = pyqtSignal(str, float, str)
     batch_template_status = pyqtSignal(str, str)
+    batch_current         = pyqtSignal(str)
     batch_finished        = pyqtSignal(dict)
 
 
+class _Task(QRunnable):
+    """Runs fn(*args) on the global QThreadPool."""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn, self.args = fn, args
+
+    def run(self):
+        try:
+            self.fn(*self.args)
+        except Exception:
+            # An exception escaping a QRunnable aborts the process under PyQt6
+            traceback.print_exc()
+
+
 # ── Helpers ───────────────────────────────────────────────────────────────────
+_LABEL_STYLES = {
+    "title":    "color:#89b4fa;",
+    "subtitle": "color:#6c7086; font-size:12px;",
+    "muted":    "color:#6c7086; font-size:11px;",
+    "success":  "color:#a6e3a1;",
+    "warning":  "color:#f9e2af;",
+    "error":    "color:#f38ba8;",
+    "normal":   "color:#cdd6f4;",
+}
+
+_TITLE_FONT = None
+
+def _title_font():
+    global _TITLE_FONT
+    if _TITLE_FONT is None:   # built on first use, once QApplication exists
+        _TITLE_FONT = QFont("Segoe UI", 16, QFont.Weight.Bold)
+    return _TITLE_FONT
+
 def _label(text, style=""):
     lbl = QLabel(text)
     if style == "title":
-        f = QFont("Segoe UI")
-        f.setPointSize(16)
-        f.setWeight(QFont.Weight.Bold)
-        lbl.setFont(f)
-        lbl.setStyleSheet("color:#89b4fa;")
-    elif style == "subtitle":
-        lbl.setStyleSheet("color:#6c7086; font-size:12px;")
-    elif style == "muted":
-        lbl.setStyleSheet("color:#6c7086; font-size:11px;")
-    elif style == "success":
-        lbl.setStyleSheet("color:#a6e3a1;")
-    elif style == "warning":
-        lbl.setStyleSheet("color:#f9e2af;")
-    elif style == "error":
-        lbl.setStyleSheet("color:#f38ba8;")
+        lbl.setFont(_title_font())
+    ss = _LABEL_STYLES.get(style)
+    if ss:
+        lbl.setStyleSheet(ss)
     return lbl
 
 def _set_label_style(lbl, style):
-    styles = {
-        "success": "color:#a6e3a1;",
-        "warning": "color:#f9e2af;",
-        "error":   "color:#f38ba8;",
-        "muted":   "color:#6c7086; font-size:11px;",
-        "normal":  "color:#cdd6f4;",
-    }
-    lbl.setStyleSheet(styles.get(style, "color:#cdd6f4;"))
+    lbl.setStyleSheet(_LABEL_STYLES.get(style) or _LABEL_STYLES["normal"])
+
+@functools.lru_cache(maxsize=8)
+def _ae_exists(path):
+    """Existence of the configured AfterFX.exe; cleared when the path is re-checked or saved."""
+    return os.path.exists(path)
+
+@functools.lru_cache(maxsize=8)
+def _read_jsx(path):
+    """Bundled injection JSX source; read once per session."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def _iter_jobs(d):
+    """DirEntry for each job_* entry in `d`; nothing if the directory is missing."""
+    try:
+        with os.scandir(d) as it:
+            yield from (e for e in it if e.name.startswith("job_"))
+    except FileNotFoundError:
+        return
+
+def _count_jobs(names):
+    """Number of job_* entries in a directory listing."""
+    return sum(1 for n in names if n.startswith("job_"))
+
+def _rmtree_all(paths):
+    """Delete job folders in parallel; rmtree is syscall-bound and releases the GIL."""
+    if len(paths) < 2:
+        for p in paths:
+            shutil.rmtree(p)
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+        list(ex.map(shutil.rmtree, paths))
 
 def _scrollable(widget):
     scroll = QScrollArea()
@@ -413,6 +424,25 @@ class AppolovaApp(QMainWindow):
         self.batch_render_active    = False
         self.batch_render_cancelled = False
         self.batch_results          = {}
+        self._ae_detected           = None   # memoized _auto_detect_after_effects hit
+        self._fs_index              = {}     # dir -> (mtime_ns, entry names)
+        self._stats_cache           = (None, None)   # (songs.db mtime_ns, get_stats())
+        self._picker                = None           # shared SmartSongPicker
+        self._picker_stats_cache    = (None, None)   # (songs.db mtime_ns, picker stats)
+        self._titles_cache          = (None, (), frozenset())  # (mtime_ns, ranked, exact)
+        self._ffmpeg_status         = None   # (text, style) from the last ffmpeg probe
+
+        # Log lines are buffered and written to the widget in one append per tick
+        self._log_queue = deque()
+        self._last_log_msg = ""
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+
+        # Generation/batch run as _Tasks on the global pool; keep its worker
+        # threads alive between runs instead of letting them expire after 30 s
+        QThreadPool.globalInstance().setExpiryTimeout(-1)
 
         self.signals = WorkerSignals()
         self.signals.log.connect(self._append_log)
@@ -422,6 +452,7 @@ class AppolovaApp(QMainWindow):
         self.signals.stats_refresh.connect(self._refresh_stats_label)
         self.signals.batch_progress.connect(self._batch_update_progress)
         self.signals.batch_template_status.connect(self._batch_update_template_status_slot)
+        self.signals.batch_current.connect(self._batch_update_current)
         self.signals.batch_finished.connect(self._batch_render_complete)
 
         # Initialise file logger
@@ -434,6 +465,17 @@ class AppolovaApp(QMainWindow):
 
         self._build_ui()
 
+        # Jobs/templates/JSX folders: refresh the status labels when their
+        # contents change instead of waiting for the next tab switch or click
+        self._fs_refresh_timer = QTimer(self)
+        self._fs_refresh_timer.setSingleShot(True)
+        self._fs_refresh_timer.setInterval(300)
+        self._fs_refresh_timer.timeout.connect(self._on_fs_changed)
+        self._fs_watcher = QFileSystemWatcher(
+            [str(p) for p in (*JOBS_DIRS.values(), TEMPLATES_DIR) if p.is_dir()], self)
+        self._fs_watcher.directoryChanged.connect(
+            lambda _: self._fs_refresh_timer.start())
+
         # Show config warnings in the log
         for w in self._config_warnings:
             self._append_log(f"Config: {w}")
@@ -443,23 +485,22 @@ class AppolovaApp(QMainWindow):
             if detected:
                 self.settings['after_effects_path'] = detected
                 self._save_settings()
-                self.ae_path_edit.setText(detected)
-                self._update_ae_status()
 
     # ── Dirs / Settings ───────────────────────────────────────────────────────
 
     def _init_directories(self):
-        for d in [AURORA_JOBS_DIR, MONO_JOBS_DIR, ONYX_JOBS_DIR,
-                  DATABASE_DIR, WHISPER_DIR, TEMPLATES_DIR]:
+        for d in _DIRS:
             d.mkdir(parents=True, exist_ok=True)
 
     def _load_settings(self):
-        if SETTINGS_FILE.exists():
-            try:
-                with open(SETTINGS_FILE, 'r') as f:
-                    return json.load(f)
-            except Exception:
-                pass
+        self._settings_bytes = None   # last serialized form on disk
+        try:
+            with open(SETTINGS_FILE, 'rb') as f:
+                settings = json.loads(f.read())
+            self._settings_bytes = json.dumps(settings, indent=2).encode("utf-8")
+            return settings
+        except Exception:
+            pass
         return {
             'after_effects_path': None,
             'genius_api_token':   Config.GENIUS_API_TOKEN,
@@ -467,10 +508,19 @@ class AppolovaApp(QMainWindow):
         }
 
     def _save_settings(self):
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(self.settings, f, indent=2)
+        data = json.dumps(self.settings, indent=2).encode("utf-8")
+        if data == self._settings_bytes:
+            return
+        # Write-then-rename so a crash mid-write never leaves a truncated file
+        tmp = SETTINGS_FILE.with_name(SETTINGS_FILE.name + ".tmp")
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, SETTINGS_FILE)
+        self._settings_bytes = data
 
     def _auto_detect_after_effects(self):
+        if self._ae_detected and Path(self._ae_detected).exists():
+            return self._ae_detected
         versions = [
             "Adobe After Effects 2025", "Adobe After Effects 2024",
             "Adobe After Effects 2023", "Adobe After Effects CC 2024",
@@ -479,13 +529,46 @@ class AppolovaApp(QMainWindow):
         ]
         for pf in [Path("C:/Program Files/Adobe"),
                    Path("C:/Program Files (x86)/Adobe")]:
-            if pf.exists():
-                for v in versions:
-                    p = pf / v / "Support Files" / "AfterFX.exe"
+            # One listing of the Adobe folder, then probe only installed versions
+            try:
+                installed = {e.name.casefold(): e.name
+                             for e in os.scandir(pf) if e.is_dir()}
+            except OSError:
+                continue
+            for v in versions:
+                name = installed.get(v.casefold())
+                if name:
+                    p = pf / name / "Support Files" / "AfterFX.exe"
                     if p.exists():
-                        return str(p)
+                        self._ae_detected = str(p)
+                        return self._ae_detected
         return None
 
+    def _dir_contents(self, p):
+        """
+        Entry names in directory `p` (None if it doesn't exist). One scandir
+        per directory, reused until the directory's mtime changes.
+        """
+        try:
+            mtime = os.stat(p).st_mtime_ns
+        except OSError:
+            self._fs_index.pop(p, None)
+            return None
+        hit = self._fs_index.get(p)
+        if hit and hit[0] == mtime:
+            return hit[1]
+        try:
+            names = frozenset(e.name for e in os.scandir(p))
+        except OSError:
+            return None
+        self._fs_index[p] = (mtime, names)
+        return names
+
+    def _job_paths(self, d):
+        """job_* entries of jobs dir `d` as Paths, from the cached listing."""
+        names = self._dir_contents(d) if d else None
+        return [d / n for n in sorted(names) if n.startswith("job_")] if names else []
+
     # ── UI ────────────────────────────────────────────────────────────────────
 
     def _build_ui(self):
@@ -500,7 +583,7 @@ class AppolovaApp(QMainWindow):
         hdr.addWidget(_label("🎬 Apollova", "title"))
         hdr.addWidget(_label("  Lyric Video Generator", "subtitle"))
         hdr.addStretch()
-        stats = self.song_db.get_stats()
+        stats = self._song_stats()
         self.stats_label = _label(
             f"📊 {stats['total_songs']} songs | {stats['cached_lyrics']} with lyrics",
             "subtitle")
@@ -516,11 +599,31 @@ class AppolovaApp(QMainWindow):
         root.addWidget(self.tabs)
 
         self._build_job_tab()
-        self._build_inject_tab()
-        self._build_settings_tab()
+        # Injection and Settings are built the first time they are opened
+        self._lazy_tabs = {
+            1: (self._build_inject_tab,   "  🚀 JSX Injection  "),
+            2: (self._build_settings_tab, "  ⚙ Settings  "),
+        }
+        for _builder, title in self._lazy_tabs.values():
+            self.tabs.addTab(QWidget(), title)
 
         self.tabs.currentChanged.connect(self._on_tab_changed)
 
+    def _ensure_tab(self, index):
+        """Swap a lazy tab's placeholder for its real page on first selection."""
+        entry = self._lazy_tabs.pop(index, None)
+        if entry is None:
+            return
+        builder, title = entry
+        page = _scrollable(builder())
+        placeholder = self.tabs.widget(index)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, page, title)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+
     # ── Job Creation Tab ──────────────────────────────────────────────────────
 
     def _build_job_tab(self):
@@ -547,7 +650,7 @@ class AppolovaApp(QMainWindow):
 
         path_row = QHBoxLayout()
         path_row.addWidget(_label("Output:", "muted"))
-        self.output_path_label = _label(str(AURORA_JOBS_DIR), "muted")
+        self.output_path_label = _label(JOBS_DIR_LABELS["aurora"], "muted")
         path_row.addWidget(self.output_path_label)
         path_row.addStretch()
         tpl_lay.addLayout(path_row)
@@ -570,7 +673,12 @@ class AppolovaApp(QMainWindow):
         ml.addWidget(QLabel("Song Title (Artist - Song):"))
         self.title_edit = QLineEdit()
         self.title_edit.setPlaceholderText("e.g. Drake - God's Plan")
-        self.title_edit.textChanged.connect(self._check_database)
+        # Look the title up once typing pauses, not on every keystroke
+        self._db_check_timer = QTimer(self)
+        self._db_check_timer.setSingleShot(True)
+        self._db_check_timer.setInterval(250)
+        self._db_check_timer.timeout.connect(self._check_database)
+        self.title_edit.textChanged.connect(lambda _: self._db_check_timer.start())
         ml.addWidget(self.title_edit)
         self.db_match_label = _label("", "muted")
         ml.addWidget(self.db_match_label)
@@ -706,8 +814,9 @@ class AppolovaApp(QMainWindow):
         prog_lay.addWidget(self.progress_bar)
         self.status_label = QLabel("Ready")
         prog_lay.addWidget(self.status_label)
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(2000)   # keep long runs O(1) per append
         self.log_text.setMinimumHeight(130)
         prog_lay.addWidget(self.log_text)
         layout.addWidget(prog_grp)
@@ -836,10 +945,7 @@ class AppolovaApp(QMainWindow):
         batch_lay.addWidget(batch_info)
         layout.addWidget(batch_grp)
         layout.addStretch()
-
-        self.tabs.addTab(_scrollable(page), "  🚀 JSX Injection  ")
-        self._update_inject_status()
-        self._update_batch_status()
+        return page
 
     # ── Settings Tab ──────────────────────────────────────────────────────────
 
@@ -885,6 +991,13 @@ class AppolovaApp(QMainWindow):
         ffmpeg_lay = QVBoxLayout(ffmpeg_grp)
         self.ffmpeg_status_label = QLabel("Checking...")
         ffmpeg_lay.addWidget(self.ffmpeg_status_label)
+        ff_row = QHBoxLayout()
+        ff_btn = QPushButton("🔄  Recheck FFmpeg")
+        ff_btn.setObjectName("muted")
+        ff_btn.clicked.connect(lambda: self._check_ffmpeg(recheck=True))
+        ff_row.addWidget(ff_btn)
+        ff_row.addStretch()
+        ffmpeg_lay.addLayout(ff_row)
         self._check_ffmpeg()
         layout.addWidget(ffmpeg_grp)
 
@@ -909,19 +1022,26 @@ class AppolovaApp(QMainWindow):
         paths_lay.addWidget(paths_lbl)
         layout.addWidget(paths_grp)
         layout.addStretch()
-
-        self.tabs.addTab(_scrollable(page), "  ⚙ Settings  ")
+        return page
 
     # ── Event handlers ────────────────────────────────────────────────────────
 
     def _on_tab_changed(self, index):
+        self._ensure_tab(index)
         if index == 1:
             self._update_inject_status()
             self._update_batch_status()
 
+    def _on_fs_changed(self):
+        if not self.is_processing:   # generation refreshes when it finishes
+            self._check_existing_jobs()
+        if 1 not in self._lazy_tabs and self.tabs.currentIndex() == 1:
+            self._update_inject_status()
+            self._update_batch_status()
+
     def _on_template_change(self):
         t = self._job_template()
-        self.output_path_label.setText(str(JOBS_DIRS.get(t, AURORA_JOBS_DIR)))
+        self.output_path_label.setText(JOBS_DIR_LABELS.get(t, JOBS_DIR_LABELS["aurora"]))
         self._check_existing_jobs()
 
     def _on_song_mode_changed(self, index):
@@ -969,7 +1089,7 @@ class AppolovaApp(QMainWindow):
             return
 
         # If the URL field is empty but the song is cached, use the cached URL
-        cached = self.song_db.get_song(title)
+        cached = None if url else self.song_db.get_song(title)
         effective_url = url or (cached['youtube_url'] if cached else "")
 
         errors = self._validate_song_record(effective_url, start, end)
@@ -1037,10 +1157,22 @@ class AppolovaApp(QMainWindow):
 
     # ── Smart Picker ──────────────────────────────────────────────────────────
 
+    def _get_picker(self):
+        if self._picker is None:
+            self._picker = SmartSongPicker(db_path=str(DATABASE_DIR / "songs.db"))
+        return self._picker
+
+    def _picker_stats(self):
+        """picker.get_database_stats(), re-queried only when songs.db has been written."""
+        mtime = self._db_mtime()
+        if mtime is None or mtime != self._picker_stats_cache[0]:
+            self._picker_stats_cache = (mtime, self._get_picker().get_database_stats())
+        return self._picker_stats_cache[1]
+
     def _refresh_smart_picker_stats(self):
         try:
-            picker = SmartSongPicker(db_path=str(DATABASE_DIR / "songs.db"))
-            stats  = picker.get_database_stats()
+            picker = self._get_picker()
+            stats  = self._picker_stats()
             if stats['total_songs'] == 0:
                 _set_label_style(self.smart_stats_label, "warning")
                 self.smart_stats_label.setText(
@@ -1114,17 +1246,12 @@ class AppolovaApp(QMainWindow):
             if not val or not val.strip():
                 errors.append(f"{label} is missing")
                 return None
-            if not _VALID_TIME.match(val.strip()):
+            m = _VALID_TIME.match(val.strip())
+            if not m:
                 errors.append(
                     f"{label} '{val}' is not in MM:SS format (e.g. 00:30)")
                 return None
-            try:
-                m, s = val.strip().split(':')
-                return int(m) * 60 + int(s)
-            except ValueError:
-                errors.append(
-                    f"{label} '{val}' contains non-numeric characters")
-                return None
+            return int(m[1]) * 60 + int(m[2])
 
         s_sec = _parse(start, "Start time")
         e_sec = _parse(end,   "End time")
@@ -1136,6 +1263,17 @@ class AppolovaApp(QMainWindow):
 
     # ── Database check ────────────────────────────────────────────────────────
 
+    def _title_index(self):
+        """
+        (ranked [(lowercase, title)], set of lowercase titles) for the title
+        lookup, reloaded only when songs.db has been written.
+        """
+        mtime = self._db_mtime()
+        if mtime is None or mtime != self._titles_cache[0]:
+            ranked = [(t.lower(), t) for t in self.song_db.list_titles()]
+            self._titles_cache = (mtime, ranked, frozenset(lt for lt, _ in ranked))
+        return self._titles_cache[1], self._titles_cache[2]
+
     def _check_database(self):
         title = self.title_edit.text().strip()
         if len(title) < 3:
@@ -1143,7 +1281,9 @@ class AppolovaApp(QMainWindow):
             for f in (self.url_edit, self.start_edit, self.end_edit):
                 self._highlight_field(f, False)
             return
-        cached = self.song_db.get_song(title)
+        key = title.lower()
+        ranked, exact = self._title_index()
+        cached = self.song_db.get_song(title) if key in exact else None
         if cached:
             url   = cached['youtube_url'] or ""
             start = cached['start_time']  or ""
@@ -1176,11 +1316,11 @@ class AppolovaApp(QMainWindow):
         else:
             for f in (self.url_edit, self.start_edit, self.end_edit):
                 self._highlight_field(f, False)
-            matches = self.song_db.search_songs(title)
+            matches = [t for lt, t in ranked if key in lt][:3]
             if matches:
                 _set_label_style(self.db_match_label, "warning")
                 self.db_match_label.setText(
-                    f"Similar: {', '.join([m[0][:25] for m in matches[:3]])}")
+                    f"Similar: {', '.join([m[:25] for m in matches])}")
             else:
                 _set_label_style(self.db_match_label, "muted")
                 self.db_match_label.setText("New song — will be saved to database.")
@@ -1190,14 +1330,11 @@ class AppolovaApp(QMainWindow):
     def _check_existing_jobs(self):
         t = self._job_template()
         d = JOBS_DIRS.get(t)
-        if not d or not d.exists():
-            self.job_warning_label.setText("")
-            self.delete_jobs_btn.setVisible(False)
-            return
-        existing = list(d.glob("job_*"))
-        if existing:
+        names = self._dir_contents(d) if d else None
+        count = _count_jobs(names) if names else 0
+        if count:
             self.job_warning_label.setText(
-                f"⚠️ {len(existing)} existing job(s) detected")
+                f"⚠️ {count} existing job(s) detected")
             self.delete_jobs_btn.setVisible(True)
         else:
             self.job_warning_label.setText("")
@@ -1209,8 +1346,7 @@ class AppolovaApp(QMainWindow):
                                 "Cannot delete jobs while processing.")
             return
         t = self._job_template()
-        d = JOBS_DIRS.get(t)
-        existing = list(d.glob("job_*"))
+        existing = self._job_paths(JOBS_DIRS.get(t))
         if not existing:
             return
         reply = QMessageBox.question(
@@ -1219,8 +1355,8 @@ class AppolovaApp(QMainWindow):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply != QMessageBox.StandardButton.Yes:
             return
-        for j in existing:
-            shutil.rmtree(j)
+        _rmtree_all(existing)
+        self._fs_index.clear()
         QMessageBox.information(self, "Deleted",
                                 f"Deleted {len(existing)} job folder(s).")
         self._check_existing_jobs()
@@ -1238,11 +1374,12 @@ class AppolovaApp(QMainWindow):
         d    = JOBS_DIRS.get(t)
         jobs_ok = template_ok = ae_ok = False
 
-        if d and d.exists():
-            jf = list(d.glob("job_*"))
+        names = self._dir_contents(d) if d else None
+        if names is not None:
+            jf = _count_jobs(names)
             if jf:
                 self.inject_jobs_label.setText(
-                    f"✓ {len(jf)} job(s) found in {d.name}")
+                    f"✓ {jf} job(s) found in {d.name}")
                 _set_label_style(self.inject_jobs_label, "success")
                 jobs_ok = True
             else:
@@ -1253,7 +1390,7 @@ class AppolovaApp(QMainWindow):
             _set_label_style(self.inject_jobs_label, "error")
 
         tp = TEMPLATE_PATHS.get(t)
-        if tp and tp.exists():
+        if tp and tp.name in (self._dir_contents(tp.parent) or ()):
             self.inject_template_label.setText(f"✓ {tp.name}")
             _set_label_style(self.inject_template_label, "success")
             template_ok = True
@@ -1263,7 +1400,7 @@ class AppolovaApp(QMainWindow):
             _set_label_style(self.inject_template_label, "error")
 
         ae = self.settings.get('after_effects_path')
-        if ae and Path(ae).exists():
+        if ae and _ae_exists(ae):
             self.inject_ae_label.setText("✓ Found")
             _set_label_style(self.inject_ae_label, "success")
             ae_ok = True
@@ -1276,7 +1413,8 @@ class AppolovaApp(QMainWindow):
     def _update_ae_status(self):
         ae = getattr(self, 'ae_path_edit', None)
         path = ae.text() if ae else (self.settings.get('after_effects_path') or '')
-        if path and Path(path).exists():
+        _ae_exists.cache_clear()
+        if path and _ae_exists(path):
             self.ae_status_label.setText("✓ After Effects found")
             _set_label_style(self.ae_status_label, "success")
         elif path:
@@ -1286,23 +1424,26 @@ class AppolovaApp(QMainWindow):
             self.ae_status_label.setText("⚠ Not configured")
             _set_label_style(self.ae_status_label, "warning")
 
-    def _check_ffmpeg(self):
+    def _check_ffmpeg(self, recheck=False):
+        # ffmpeg -version is only spawned once per session unless asked again
+        if recheck or self._ffmpeg_status is None:
+            self._ffmpeg_status = self._probe_ffmpeg()
+        text, style = self._ffmpeg_status
+        self.ffmpeg_status_label.setText(text)
+        _set_label_style(self.ffmpeg_status_label, style)
+
+    @staticmethod
+    def _probe_ffmpeg():
         try:
             r = subprocess.run(['ffmpeg', '-version'],
-                               capture_output=True, text=True, timeout=5)
+                               capture_output=True, text=True, timeout=5, **_POPEN_KW)
             if r.returncode == 0:
-                self.ffmpeg_status_label.setText("✓ FFmpeg found in PATH")
-                _set_label_style(self.ffmpeg_status_label, "success")
-            else:
-                self.ffmpeg_status_label.setText("✗ FFmpeg not working properly")
-                _set_label_style(self.ffmpeg_status_label, "error")
+                return "✓ FFmpeg found in PATH", "success"
+            return "✗ FFmpeg not working properly", "error"
         except FileNotFoundError:
-            self.ffmpeg_status_label.setText(
-                "✗ FFmpeg not found — install and add to PATH")
-            _set_label_style(self.ffmpeg_status_label, "error")
+            return "✗ FFmpeg not found — install and add to PATH", "error"
         except Exception as e:
-            self.ffmpeg_status_label.setText(f"✗ Error: {e}")
-            _set_label_style(self.ffmpeg_status_label, "error")
+            return f"✗ Error: {e}", "error"
 
     def _browse_ae_path(self):
         path, _ = QFileDialog.getOpenFileName(
@@ -1325,6 +1466,7 @@ class AppolovaApp(QMainWindow):
                                 "Could not auto-detect After Effects.\n\nPlease browse manually.")
 
     def _save_all_settings(self):
+        _ae_exists.cache_clear()
         self.settings['after_effects_path'] = self.ae_path_edit.text()
         self.settings['genius_api_token']   = self.genius_edit.text()
         self.settings['whisper_model']      = self.whisper_combo.currentText()
@@ -1336,7 +1478,8 @@ class AppolovaApp(QMainWindow):
             f.write(f"GENIUS_API_TOKEN={self.genius_edit.text()}\n")
             f.write(f"WHISPER_MODEL={self.whisper_combo.currentText()}\n")
         QMessageBox.information(self, "Saved", "Settings saved successfully!")
-        self._update_inject_status()
+        if 1 not in self._lazy_tabs:
+            self._update_inject_status()
 
     # ── JSX Injection ─────────────────────────────────────────────────────────
 
@@ -1349,10 +1492,8 @@ class AppolovaApp(QMainWindow):
         if self._log:
             self._log.section(f"JSX injection — template={t.upper()}, jsx={jsx}")
         try:
-            src = BUNDLED_JSX_DIR / jsx
-            if not src.exists():
-                src = ASSETS_DIR / "scripts" / "JSX" / jsx
-            if not src.exists():
+            src = RESOLVED_JSX.get(t)
+            if src is None:
                 if self._log:
                     self._log.error(f"JSX script not found: {jsx}")
                 QMessageBox.critical(self, "Error",
@@ -1361,8 +1502,7 @@ class AppolovaApp(QMainWindow):
             tmp = Path(tempfile.gettempdir()) / "Apollova"
             tmp.mkdir(exist_ok=True)
             dst = tmp / jsx
-            shutil.copy(src, dst)
-            self._prepare_jsx_with_path(dst, d, tp)
+            self._prepare_jsx_with_path(src, dst, d, tp)
             if self._log:
                 self._log.info(f"JSX prepared at {dst} | jobs={d} | template={tp}")
         except Exception as e:
@@ -1372,7 +1512,7 @@ class AppolovaApp(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to prepare JSX:\n{e}")
             return
         try:
-            subprocess.Popen([ae, "-r", str(dst)])
+            subprocess.Popen([ae, "-r", str(dst)], **_POPEN_KW)
             if self._log:
                 self._log.info(f"After Effects launched: {ae}")
             QMessageBox.information(self, "Launched",
@@ -1385,39 +1525,39 @@ class AppolovaApp(QMainWindow):
             QMessageBox.critical(self, "Error",
                                  f"Failed to launch After Effects:\n{e}")
 
-    def _prepare_jsx_with_path(self, jsx_path, jobs_dir,
+    def _prepare_jsx_with_path(self, src, dst, jobs_dir,
                                template_path, auto_render=False):
-        with open(jsx_path, 'r', encoding='utf-8') as f:
-            c = f.read()
-        c = c.replace('{{JOBS_PATH}}',     str(jobs_dir).replace('\\', '/'))
-        c = c.replace('{{TEMPLATE_PATH}}', str(template_path).replace('\\', '/'))
-        c = c.replace('{{AUTO_RENDER}}',   'true' if auto_render else 'false')
-        with open(jsx_path, 'w', encoding='utf-8') as f:
+        """Write the bundled JSX `src` to `dst` with its placeholders filled in."""
+        c = _read_jsx(str(src))
+        subs = {
+            'JOBS_PATH':     str(jobs_dir).replace('\\', '/'),
+            'TEMPLATE_PATH': str(template_path).replace('\\', '/'),
+            'AUTO_RENDER':   'true' if auto_render else 'false',
+        }
+        c = _JSX_SUBST_RE.sub(lambda m: subs[m.group(1)], c)
+        with open(dst, 'w', encoding='utf-8') as f:
             f.write(c)
 
     # ── Batch Render ──────────────────────────────────────────────────────────
 
     def _update_batch_status(self):
-        ready = []
+        ready = {}   # template -> job count, for templates that can render
         ae    = self.settings.get('after_effects_path')
-        ae_ok = ae and Path(ae).exists()
+        ae_ok = ae and _ae_exists(ae)
+        templates = self._dir_contents(TEMPLATES_DIR) or ()
         for t in ['aurora', 'mono', 'onyx']:
             d   = JOBS_DIRS.get(t)
             tp  = TEMPLATE_PATHS.get(t)
-            jsx = JSX_SCRIPTS.get(t)
-            jobs_ok = d and d.exists() and list(d.glob("job_*"))
-            tpl_ok  = tp and tp.exists()
-            src     = BUNDLED_JSX_DIR / jsx if jsx else None
-            if src and not src.exists():
-                src = ASSETS_DIR / "scripts" / "JSX" / jsx
-            jsx_ok = src and src.exists()
+            names   = self._dir_contents(d) if d else None
+            cnt     = _count_jobs(names) if names else 0
+            tpl_ok  = tp and tp.name in templates
+            jsx_ok  = RESOLVED_JSX.get(t) is not None
             lbl = self.batch_status_labels[t]
-            if jobs_ok:
-                cnt = len(list(d.glob("job_*")))
+            if cnt:
                 if tpl_ok and jsx_ok:
                     lbl.setText(f"  {t.capitalize()}: {cnt} jobs ready")
                     _set_label_style(lbl, "success")
-                    ready.append(t)
+                    ready[t] = cnt
                 elif not tpl_ok:
                     lbl.setText(f"  {t.capitalize()}: {cnt} jobs (no template)")
                     _set_label_style(lbl, "warning")
@@ -1438,8 +1578,8 @@ class AppolovaApp(QMainWindow):
                 "Need at least 2 templates with jobs.")
             return
         lines = ["Ready to render:"]
-        for t in ready:
-            lines.append(f"  - {t.capitalize()}: {len(list(JOBS_DIRS[t].glob('job_*')))} jobs")
+        for t, cnt in ready.items():
+            lines.append(f"  - {t.capitalize()}: {cnt} jobs")
         lines += ["", "This will take a while. Continue?"]
         reply = QMessageBox.question(self, "Confirm Batch Render", "\n".join(lines),
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
@@ -1451,8 +1591,7 @@ class AppolovaApp(QMainWindow):
         self.render_all_btn.setEnabled(False)
         self.batch_cancel_btn.setEnabled(True)
         self.inject_btn.setEnabled(False)
-        threading.Thread(target=self._batch_render_thread,
-                         args=(ready,), daemon=True).start()
+        QThreadPool.globalInstance().start(_Task(self._batch_render_thread, list(ready)))
 
     def _cancel_batch_render(self):
         reply = QMessageBox.question(self, "Cancel",
@@ -1489,21 +1628,30 @@ class AppolovaApp(QMainWindow):
         d   = JOBS_DIRS.get(t)
         jsx = JSX_SCRIPTS.get(t)
         try:
-            src = BUNDLED_JSX_DIR / jsx
-            if not src.exists():
-                src = ASSETS_DIR / "scripts" / "JSX" / jsx
-            if not src.exists():
+            src = RESOLVED_JSX.get(t)
+            if src is None:
                 return False, f"JSX not found: {jsx}"
             tmp = Path(tempfile.gettempdir()) / "Apollova"
             tmp.mkdir(exist_ok=True)
             dst = tmp / f"batch_{jsx}"
-            shutil.copy(src, dst)
-            self._prepare_jsx_with_path(dst, d, tp, auto_render=True)
+            self._prepare_jsx_with_path(src, dst, d, tp, auto_render=True)
             err_log = d / "batch_error.txt"
             if err_log.exists():
                 err_log.unlink()
-            p = subprocess.Popen([ae, "-r", str(dst)])
-            p.wait()
+            p = subprocess.Popen([ae, "-r", str(dst)], **_POPEN_KW)
+            # Wait in short slices so the UI can show elapsed time and a pending
+            # cancel. AE itself is left to finish the template (see the cancel prompt).
+            started = time.monotonic()
+            while True:
+                try:
+                    p.wait(timeout=1)
+                    break
+                except subprocess.TimeoutExpired:
+                    mins, secs = divmod(int(time.monotonic() - started), 60)
+                    msg = f"Rendering {t.capitalize()}… {mins}:{secs:02}"
+                    if self.batch_render_cancelled:
+                        msg += "  (cancelling after this template)"
+                    self.signals.batch_current.emit(msg)
             if err_log.exists():
                 return False, err_log.read_text().strip()
             return True, None
@@ -1515,6 +1663,9 @@ class AppolovaApp(QMainWindow):
         self.batch_progress_bar.setValue(int(progress))
         self.batch_current_label.setText(current)
 
+    def _batch_update_current(self, text):
+        self.batch_current_label.setText(text)
+
     def _batch_update_template_status_slot(self, template, text):
         lbl = self.batch_status_labels.get(template)
         if lbl:
@@ -1529,17 +1680,16 @@ class AppolovaApp(QMainWindow):
         self.inject_btn.setEnabled(True)
         self.batch_progress_bar.setValue(100)
         sc = sum(1 for r in results.values() if r['success'])
-        fc = sum(1 for r in results.values() if not r['success'])
+        fc = len(results) - sc
         if self.batch_render_cancelled:
             self.batch_status_label.setText("Status: Cancelled")
             self.batch_current_label.setText(f"Completed {sc} before cancellation")
         else:
             self.batch_status_label.setText("Status: Complete")
             self.batch_current_label.setText(f"Success: {sc}, Failed: {fc}")
-        lines = ["Batch Render Complete\n"]
-        for t, r in results.items():
-            lines.append(
-                f"{t.capitalize()}: {'Success' if r['success'] else 'Failed — ' + str(r['error'])}")
+        lines = ["Batch Render Complete\n"] + [
+            f"{t.capitalize()}: {'Success' if r['success'] else 'Failed — ' + str(r['error'])}"
+            for t, r in results.items()]
         if self.batch_render_cancelled:
             lines.append("\nCancelled by user.")
         QMessageBox.information(self, "Batch Render Complete", "\n".join(lines))
@@ -1550,8 +1700,8 @@ class AppolovaApp(QMainWindow):
     def _validate_inputs(self):
         errors = []
         if self.use_smart_picker:
-            picker = SmartSongPicker(db_path=str(DATABASE_DIR / "songs.db"))
-            stats  = picker.get_database_stats()
+            picker = self._get_picker()
+            stats  = self._picker_stats()
             if stats['total_songs'] == 0:
                 errors.append("Database empty. Add songs via Manual Entry first.")
             else:
@@ -1604,13 +1754,11 @@ class AppolovaApp(QMainWindow):
         if not self._validate_inputs():
             return
         t    = self._job_template()
-        d    = JOBS_DIRS.get(t)
-        existing = list(d.glob("job_*")) if d.exists() else []
+        existing = self._job_paths(JOBS_DIRS.get(t))
 
         if self.use_smart_picker:
             num  = int(self.jobs_combo.currentText())
-            picker = SmartSongPicker(db_path=str(DATABASE_DIR / "songs.db"))
-            songs  = picker.get_available_songs(num_songs=num)
+            songs  = self._get_picker().get_available_songs(num_songs=num)
             sl = "\n".join(
                 [f"  {i+1}. {s['song_title'][:40]}" for i, s in enumerate(songs[:12])])
             if len(songs) > 12:
@@ -1622,8 +1770,9 @@ class AppolovaApp(QMainWindow):
                 return
 
         if existing:
-            complete   = [j for j in existing if (j / "job_data.json").exists()]
-            incomplete = [j for j in existing if not (j / "job_data.json").exists()]
+            complete, incomplete = [], []
+            for j in existing:
+                (complete if (j / "job_data.json").exists() else incomplete).append(j)
             detail = f"Found {len(existing)} existing job(s)"
             if complete:
                 detail += f"\n  • {len(complete)} complete"
@@ -1649,13 +1798,11 @@ class AppolovaApp(QMainWindow):
 
             clicked = dlg.clickedButton()
             if clicked == delete_btn:
-                for j in existing:
-                    shutil.rmtree(j)
+                _rmtree_all(existing)
                 self._resume_mode = False
                 self._check_existing_jobs()
             elif clicked == resume_btn:
-                for j in incomplete:
-                    shutil.rmtree(j)
+                _rmtree_all(incomplete)
                 self._resume_mode = True
             else:
                 return
@@ -1665,9 +1812,10 @@ class AppolovaApp(QMainWindow):
         self._lock_inputs(True)
         self.generate_btn.setEnabled(False)
         self.cancel_btn.setEnabled(True)
+        self._log_queue.clear()
         self.log_text.clear()
         self.progress_bar.setValue(0)
-        threading.Thread(target=self._process_jobs, daemon=True).start()
+        QThreadPool.globalInstance().start(_Task(self._process_jobs))
 
     def _cancel_generation(self):
         self.cancel_requested = True
@@ -1702,13 +1850,13 @@ class AppolovaApp(QMainWindow):
 
             if self.use_smart_picker:
                 self.signals.log.emit(f"🤖 Smart Picker: {num} songs | {t.upper()}")
-                picker   = SmartSongPicker(db_path=str(DATABASE_DIR / "songs.db"))
+                picker   = self._get_picker()
                 outd.mkdir(parents=True, exist_ok=True)
 
                 start_idx = 1
                 if self._resume_mode:
-                    done = [j for j in outd.glob("job_*")
-                            if (j / "job_data.json").exists()]
+                    done = [e for e in _iter_jobs(outd)
+                            if os.path.exists(os.path.join(e.path, "job_data.json"))]
                     start_idx = len(done) + 1
                     remaining = num - len(done)
                     if remaining <= 0:
@@ -1722,40 +1870,31 @@ class AppolovaApp(QMainWindow):
                 else:
                     songs = picker.get_available_songs(num_songs=num)
 
-                for i, s in enumerate(songs):
-                    idx = start_idx + i
-                    if self.cancel_requested:
-                        raise Exception("Cancelled by user")
-                    self.signals.log.emit(
-                        f"\n{'='*40}\n📀 Job {idx}/{num}: {s['song_title'][:40]}")
-                    self._process_single_song(
-                        idx, s['song_title'], s['youtube_url'],
-                        s['start_time'], s['end_time'], t, outd)
-                    picker.mark_song_used(s['song_title'])
-                    self.signals.progress.emit(idx / num * 100)
+                jobs = [(idx, s['song_title'], s['youtube_url'],
+                         s['start_time'], s['end_time'])
+                        for idx, s in enumerate(songs, start_idx)]
+                self._run_job_list(jobs, t, outd, num,
+                                   on_done=picker.mark_song_used)
                 self.signals.log.emit(
-                    f"\n{'='*40}\n🎉 SUCCESS! {num} job(s) created!\n📂 {outd}\n"
+                    f"\n{_RULE}\n🎉 SUCCESS! {num} job(s) created!\n📂 {outd}\n"
                     "Next: Go to JSX Injection tab")
             else:
                 total = len(self._job_queue)
                 self.signals.log.emit(f"Starting {total} queued job(s) | {t.upper()}")
                 outd.mkdir(parents=True, exist_ok=True)
+                pct = 100.0 / total if total else 0.0
+                jobs = []
                 for idx, job in enumerate(self._job_queue, 1):
-                    if self.cancel_requested:
-                        raise Exception("Cancelled by user")
+                    title = job['title']
                     if self._resume_mode and (outd / f"job_{idx:03}" / "job_data.json").exists():
                         self.signals.log.emit(
-                            f"\n{'='*40}\n⏭ Job {idx}/{total}: {job['title'][:40]} — skipping (complete)")
-                        self.signals.progress.emit(idx / total * 100)
+                            f"\n{_RULE}\n⏭ Job {idx}/{total}: {title[:40]} — skipping (complete)")
+                        self.signals.progress.emit(idx * pct)
                         continue
-                    self.signals.log.emit(
-                        f"\n{'='*40}\n📀 Job {idx}/{total}: {job['title'][:40]}")
-                    self._process_single_song(
-                        idx, job['title'], job['url'],
-                        job['start'], job['end'], t, outd)
-                    self.signals.progress.emit(idx / total * 100)
+                    jobs.append((idx, title, job['url'], job['start'], job['end']))
+                self._run_job_list(jobs, t, outd, total)
                 self.signals.log.emit(
-                    f"\n{'='*40}\n🎉 SUCCESS! {total} job(s) created!\n📂 {outd}\n"
+                    f"\n{_RULE}\n🎉 SUCCESS! {total} job(s) created!\n📂 {outd}\n"
                     "Next: Go to JSX Injection tab")
 
             self.signals.stats_refresh.emit()
@@ -1769,6 +1908,8 @@ class AppolovaApp(QMainWindow):
             self.signals.error.emit(str(e))
 
     def _on_generation_finished(self):
+        self._flush_log()
+        self._fs_index.clear()
         self.is_processing  = False
         self._resume_mode   = False
         self._job_queue.clear()
@@ -1783,6 +1924,8 @@ class AppolovaApp(QMainWindow):
             "Go to JSX Injection tab to inject into After Effects.")
 
     def _on_generation_error(self, msg):
+        self._flush_log()
+        self._fs_index.clear()
         self.is_processing = False
         self._resume_mode  = False
         self._lock_inputs(False)
@@ -1792,9 +1935,11 @@ class AppolovaApp(QMainWindow):
         QMessageBox.critical(self, "Error", msg)
 
     def _append_log(self, msg):
-        ts = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{ts}] {msg}")
-        self.status_label.setText(msg[:80])
+        ts = time.strftime("%H:%M:%S")
+        self._log_queue.append(f"[{ts}] {msg}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+        self._last_log_msg = msg
         if self._log:
             if "❌" in msg or "error" in msg.lower() or "fail" in msg.lower():
                 self._log.error(msg)
@@ -1803,50 +1948,158 @@ class AppolovaApp(QMainWindow):
             else:
                 self._log.info(msg)
 
+    def _flush_log(self):
+        self._log_timer.stop()
+        if not self._log_queue:
+            return
+        lines = "\n".join(self._log_queue)
+        self._log_queue.clear()
+        self.log_text.appendPlainText(lines)
+        self.status_label.setText(self._last_log_msg[:80])
+
+    def _db_mtime(self):
+        try:
+            return os.stat(self.song_db.db_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _song_stats(self):
+        """song_db.get_stats(), re-queried only when songs.db has been written."""
+        mtime = self._db_mtime()
+        if mtime is None or mtime != self._stats_cache[0]:
+            self._stats_cache = (mtime, self.song_db.get_stats())
+        return self._stats_cache[1]
+
     def _refresh_stats_label(self):
-        s = self.song_db.get_stats()
+        s = self._song_stats()
         self.stats_label.setText(
             f"📊 {s['total_songs']} songs | {s['cached_lyrics']} with lyrics")
 
     # ── Single song processing (logic unchanged from original) ────────────────
 
-    def _process_single_song(self, job_number, song_title, youtube_url,
-                              start_time, end_time, template, output_dir,
-                              return_data=False):
+    def _prepare_song_audio(self, job_number, song_title, youtube_url,
+                            start_time, end_time, output_dir, ahead=False):
+        """Create the job folder, then download and trim its audio.
+
+        Returns the tuple _process_single_song works from. With ahead=True
+        this is the next job being prepared while the current one is in
+        Whisper, so its log lines carry the job number."""
+        tag = f"  [Job {job_number}] " if ahead else "  "
         job_folder  = output_dir / f"job_{job_number:03}"
         job_folder.mkdir(parents=True, exist_ok=True)
-        needs_image = template in ['aurora', 'onyx']
+        # What a resumed/partial job already has on disk, from one listing.
+        # Only used for the "skip this step?" checks; files written by the
+        # steps below are still checked directly.
+        with os.scandir(job_folder) as it:
+            present = {e.name for e in it}
         cached      = self.song_db.get_song(song_title)
 
         if cached:
-            self.signals.log.emit("  ✓ Using cached data")
+            self.signals.log.emit(f"{tag}✓ Using cached data")
             youtube_url = cached['youtube_url']
             start_time  = cached['start_time']
             end_time    = cached['end_time']
 
-        def chk():
+        # Audio download — a fresh job fetches just the clip, which also
+        # produces audio_trimmed.wav; a partial/resumed one keeps the
+        # full download + trim below.
+        if self.cancel_requested:
+            raise Exception("Cancelled")
+        has_source = any(n.startswith("audio_source.") for n in present)
+        if not has_source and "audio_trimmed.wav" not in present:
+            self.signals.log.emit(f"{tag}Downloading clip ({start_time} → {end_time})…")
+            try:
+                # One attempt: a failure (private, age-gated, no ranges support)
+                # falls back to the full download, which has its own retries
+                download_audio_section(youtube_url, str(job_folder),
+                                       start_time, end_time, max_retries=1)
+                self.signals.log.emit(f"{tag}✓ Clip downloaded")
+                return job_folder, present, cached, youtube_url, start_time, end_time
+            except Exception as e:
+                self.signals.log.emit(f"{tag}⚠ Clip download failed ({e}); fetching full audio")
             if self.cancel_requested:
                 raise Exception("Cancelled")
-
-        # Audio download
-        chk()
-        audio_path = job_folder / "audio_source.mp3"
-        if not audio_path.exists():
-            self.signals.log.emit("  Downloading audio…")
+        if not has_source:
+            self.signals.log.emit(f"{tag}Downloading audio…")
             self._run_step(job_number, "Audio download", download_audio, youtube_url, str(job_folder))
-            self.signals.log.emit("  ✓ Audio downloaded")
+            self.signals.log.emit(f"{tag}✓ Audio downloaded")
         else:
-            self.signals.log.emit("  ✓ Audio exists")
+            self.signals.log.emit(f"{tag}✓ Audio exists")
 
         # Trim
-        chk()
-        trimmed = job_folder / "audio_trimmed.wav"
-        if not trimmed.exists():
-            self.signals.log.emit(f"  Trimming ({start_time} → {end_time})…")
+        if self.cancel_requested:
+            raise Exception("Cancelled")
+        if "audio_trimmed.wav" not in present:
+            self.signals.log.emit(f"{tag}Trimming ({start_time} → {end_time})…")
             self._run_step(job_number, "Audio trim", trim_audio, str(job_folder), start_time, end_time)
-            self.signals.log.emit("  ✓ Trimmed")
+            self.signals.log.emit(f"{tag}✓ Trimmed")
         else:
-            self.signals.log.emit("  ✓ Trimmed audio exists")
+            self.signals.log.emit(f"{tag}✓ Trimmed audio exists")
+
+        return job_folder, present, cached, youtube_url, start_time, end_time
+
+    def _needs_transcription(self, song_title, template):
+        """True when the song has no cached lyrics for this template."""
+        if template == 'mono':
+            return not self.song_db.get_mono_lyrics(song_title)
+        if template == 'onyx':
+            return not self.song_db.get_onyx_lyrics(song_title)
+        cached = self.song_db.get_song(song_title)
+        return not (cached and cached.get('transcribed_lyrics'))
+
+    def _run_job_list(self, jobs, template, output_dir, total, on_done=None):
+        """Process (idx, title, url, start, end) jobs in order.
+
+        The next job's download + trim runs on a side thread while the
+        current job transcribes, so after the first job the network and
+        ffmpeg time is off the critical path."""
+        pct  = 100.0 / total if total else 0.0
+        if any(self._needs_transcription(j[1], template) for j in jobs):
+            # Load Whisper (and run it once) while the first job downloads
+            QThreadPool.globalInstance().start(_Task(warmup_whisper))
+        pool = ThreadPoolExecutor(max_workers=1)
+        ahead = None
+        try:
+            for n, (idx, title, url, start, end) in enumerate(jobs):
+                if self.cancel_requested:
+                    raise Exception("Cancelled by user")
+                self.signals.log.emit(
+                    f"\n{_RULE}\n📀 Job {idx}/{total}: {title[:40]}")
+                prepared = ahead.result() if ahead is not None else None
+                ahead = None
+                if n + 1 < len(jobs):
+                    ahead = pool.submit(self._prepare_song_audio,
+                                        *jobs[n + 1], output_dir, ahead=True)
+                self._process_single_song(
+                    idx, title, url, start, end, template, output_dir,
+                    prepared=prepared)
+                if on_done:
+                    on_done(title)
+                self.signals.progress.emit(idx * pct)
+        except BaseException:
+            # The next job's download/trim must not keep writing into its
+            # folder once the UI unlocks (Delete / Resume may rmtree it):
+            # drop it if queued, else stop it at its next cancel check.
+            if ahead is not None and not ahead.cancel():
+                self.cancel_requested = True
+                futures_wait([ahead])
+            raise
+        finally:
+            pool.shutdown(wait=False)
+
+    def _process_single_song(self, job_number, song_title, youtube_url,
+                              start_time, end_time, template, output_dir,
+                              return_data=False, prepared=None):
+        if prepared is None:
+            prepared = self._prepare_song_audio(
+                job_number, song_title, youtube_url,
+                start_time, end_time, output_dir)
+        job_folder, present, cached, youtube_url, start_time, end_time = prepared
+        needs_image = template in ['aurora', 'onyx']
+
+        def chk():
+            if self.cancel_requested:
+                raise Exception("Cancelled")
 
         # Beats (Aurora only)
         beats = []
@@ -1855,104 +2108,132 @@ class AppolovaApp(QMainWindow):
             beats_path = job_folder / "beats.json"
             if cached and cached.get('beats'):
                 beats = cached['beats']
-                with open(beats_path, 'w') as f:
-                    json.dump(beats, f, indent=4)
+                _write_json(beats_path, beats)
                 self.signals.log.emit("  ✓ Cached beats")
-            elif not beats_path.exists():
+            elif "beats.json" not in present:
                 self.signals.log.emit("  Detecting beats…")
                 beats = self._run_step(job_number, "Beat detection", detect_beats, str(job_folder))
-                with open(beats_path, 'w') as f:
-                    json.dump(beats, f, indent=4)
+                _write_json(beats_path, beats)
                 self.signals.log.emit(f"  ✓ {len(beats)} beats")
             else:
-                with open(beats_path) as f:
-                    beats = json.load(f)
+                beats = _read_json(beats_path)
                 self.signals.log.emit("  ✓ Beats exist")
 
-        # Transcribe (per-template)
-        chk()
-        lyrics_path = job_folder / "lyrics.txt"
-        if template == 'aurora':
-            if cached and cached.get('transcribed_lyrics'):
-                with open(lyrics_path, 'w', encoding='utf-8') as f:
-                    json.dump(cached['transcribed_lyrics'], f, indent=4, ensure_ascii=False)
-                self.signals.log.emit(
-                    f"  ✓ Cached lyrics ({len(cached['transcribed_lyrics'])} segs)")
-            elif not lyrics_path.exists():
-                self.signals.log.emit(f"  Transcribing ({Config.WHISPER_MODEL})…")
-                t0 = time.time()
-                self._run_step(job_number, "Whisper transcription (Aurora)", transcribe_audio, str(job_folder), song_title)
-                elapsed = time.time() - t0
-                self.signals.log.emit(
-                    f"  ✓ Transcribed ({elapsed:.0f}s)")
-            else:
-                self.signals.log.emit("  ✓ Lyrics exist")
-            lyrics_data = lyrics_path.read_text() if lyrics_path.exists() else ""
-
-        elif template == 'mono':
-            mono_path = job_folder / "mono_data.json"
-            cached_mono = self.song_db.get_mono_lyrics(song_title)
-            if cached_mono:
-                with open(mono_path, 'w', encoding='utf-8') as f:
-                    json.dump(cached_mono, f, indent=4, ensure_ascii=False)
-                self.signals.log.emit("  ✓ Cached mono lyrics")
-            elif not mono_path.exists():
-                self.signals.log.emit(f"  Transcribing mono ({Config.WHISPER_MODEL})…")
-                t0 = time.time()
-                self._run_step(job_number, "Whisper transcription (Mono)", transcribe_audio_mono, str(job_folder), song_title)
-                elapsed = time.time() - t0
-                self.signals.log.emit(
-                    f"  ✓ Transcribed mono ({elapsed:.0f}s)")
-            else:
-                self.signals.log.emit("  ✓ Mono data exists")
-            lyrics_data = mono_path.read_text() if mono_path.exists() else "{}"
-
-        elif template == 'onyx':
-            onyx_path = job_folder / "onyx_data.json"
-            cached_onyx = self.song_db.get_onyx_lyrics(song_title)
-            if cached_onyx:
-                with open(onyx_path, 'w', encoding='utf-8') as f:
-                    json.dump(cached_onyx, f, indent=4, ensure_ascii=False)
-                self.signals.log.emit("  ✓ Cached onyx lyrics")
-            elif not onyx_path.exists():
-                self.signals.log.emit(f"  Transcribing onyx ({Config.WHISPER_MODEL})…")
-                t0 = time.time()
-                self._run_step(job_number, "Whisper transcription (Onyx)", transcribe_audio_onyx, str(job_folder), song_title)
-                elapsed = time.time() - t0
-                self.signals.log.emit(
-                    f"  ✓ Transcribed onyx ({elapsed:.0f}s)")
-            else:
-                self.signals.log.emit("  ✓ Onyx data exists")
-            lyrics_data = onyx_path.read_text() if onyx_path.exists() else "{}"
-
-        else:
-            lyrics_data = ""
-
-        # Image / colors
+        # Image / colors — network + CPU work independent of Whisper, so it
+        # runs on a side thread while the transcription below proceeds.
         image_path = job_folder / "cover.png"
         colors     = ['#ffffff', '#000000']
-        if needs_image:
+
+        def cover_and_colors():
+            """Returns (colors, cover_exists)."""
             chk()
             if cached and cached.get('genius_image_url'):
-                if not image_path.exists():
+                if "cover.png" not in present:
                     self.signals.log.emit("  Downloading cached image…")
                     self._run_step(job_number, "Image download", download_image, str(job_folder), cached['genius_image_url'])
                 self.signals.log.emit("  ✓ Cached image")
-            elif not image_path.exists():
+            elif "cover.png" not in present:
                 self.signals.log.emit("  Fetching cover…")
                 ok = self._run_step(job_number, "Genius image fetch", fetch_genius_image, song_title, str(job_folder))
                 self.signals.log.emit("  ✓ Cover" if ok else "  ⚠ No cover")
             else:
                 self.signals.log.emit("  ✓ Cover exists")
             chk()
-            if image_path.exists():
-                if cached and cached.get('colors'):
-                    colors = cached['colors']
-                    self.signals.log.emit("  ✓ Cached colors")
+            if not image_path.exists():
+                return colors, False
+            if cached and cached.get('colors'):
+                self.signals.log.emit("  ✓ Cached colors")
+                return cached['colors'], True
+            # Songs off the same album share a cover: reuse its palette
+            cover_hash = hashlib.sha1(image_path.read_bytes()).hexdigest()
+            found = self.song_db.get_palette(cover_hash)
+            if found:
+                self.signals.log.emit(f"  ✓ Colors (same cover): {', '.join(found)}")
+                return found, True
+            self.signals.log.emit("  Extracting colors…")
+            found = self._run_step(job_number, "Color extraction", extract_colors, str(job_folder))
+            self.signals.log.emit(f"  ✓ Colors: {', '.join(found)}")
+            if found != _EXTRACT_FAILED_COLORS:
+                self.song_db.save_palette(cover_hash, found)
+            return found, True
+
+        image_future = None
+        if needs_image:
+            pool = ThreadPoolExecutor(max_workers=1)
+            image_future = pool.submit(cover_and_colors)
+            pool.shutdown(wait=False)
+
+        try:
+            # Transcribe (per-template)
+            chk()
+            lyrics_path = job_folder / "lyrics.txt"
+            lyrics_data = None     # set directly when written from cache
+            if template == 'aurora':
+                if cached and cached.get('transcribed_lyrics'):
+                    lyrics_data = _write_json(
+                        lyrics_path, cached['transcribed_lyrics']).decode("utf-8")
+                    self.signals.log.emit(
+                        f"  ✓ Cached lyrics ({len(cached['transcribed_lyrics'])} segs)")
+                elif "lyrics.txt" not in present:
+                    self.signals.log.emit(f"  Transcribing ({Config.WHISPER_MODEL})…")
+                    t0 = time.time()
+                    self._run_step(job_number, "Whisper transcription (Aurora)", transcribe_audio, str(job_folder), song_title)
+                    elapsed = time.time() - t0
+                    self.signals.log.emit(
+                        f"  ✓ Transcribed ({elapsed:.0f}s)")
+                else:
+                    self.signals.log.emit("  ✓ Lyrics exist")
+                if lyrics_data is None:
+                    lyrics_data = _read_text_or(lyrics_path, "")
+
+            elif template == 'mono':
+                mono_path = job_folder / "mono_data.json"
+                cached_mono = self.song_db.get_mono_lyrics(song_title)
+                if cached_mono:
+                    lyrics_data = _write_json(mono_path, cached_mono).decode("utf-8")
+                    self.signals.log.emit("  ✓ Cached mono lyrics")
+                elif "mono_data.json" not in present:
+                    self.signals.log.emit(f"  Transcribing mono ({Config.WHISPER_MODEL})…")
+                    t0 = time.time()
+                    self._run_step(job_number, "Whisper transcription (Mono)", transcribe_audio_mono, str(job_folder), song_title)
+                    elapsed = time.time() - t0
+                    self.signals.log.emit(
+                        f"  ✓ Transcribed mono ({elapsed:.0f}s)")
+                else:
+                    self.signals.log.emit("  ✓ Mono data exists")
+                if lyrics_data is None:
+                    lyrics_data = _read_text_or(mono_path, "{}")
+
+            elif template == 'onyx':
+                onyx_path = job_folder / "onyx_data.json"
+                cached_onyx = self.song_db.get_onyx_lyrics(song_title)
+                if cached_onyx:
+                    lyrics_data = _write_json(onyx_path, cached_onyx).decode("utf-8")
+                    self.signals.log.emit("  ✓ Cached onyx lyrics")
+                elif "onyx_data.json" not in present:
+                    self.signals.log.emit(f"  Transcribing onyx ({Config.WHISPER_MODEL})…")
+                    t0 = time.time()
+                    self._run_step(job_number, "Whisper transcription (Onyx)", transcribe_audio_onyx, str(job_folder), song_title)
+                    elapsed = time.time() - t0
+                    self.signals.log.emit(
+                        f"  ✓ Transcribed onyx ({elapsed:.0f}s)")
                 else:
-                    self.signals.log.emit("  Extracting colors…")
-                    colors = self._run_step(job_number, "Color extraction", extract_colors, str(job_folder))
-                    self.signals.log.emit(f"  ✓ Colors: {', '.join(colors)}")
+                    self.signals.log.emit("  ✓ Onyx data exists")
+                if lyrics_data is None:
+                    lyrics_data = _read_text_or(onyx_path, "{}")
+
+            else:
+                lyrics_data = ""
+        except BaseException:
+            # A failed/cancelled job must not leave the cover thread
+            # downloading or saving a palette after it is reported
+            if image_future is not None and not image_future.cancel():
+                futures_wait([image_future])
+            raise
+
+        has_cover = "cover.png" in present
+        if image_future is not None:
+            colors, has_cover = image_future.result()
 
         data_file = {
             'aurora': job_folder / "lyrics.txt",
@@ -1965,28 +2246,30 @@ class AppolovaApp(QMainWindow):
             "youtube_url": youtube_url, "start_time": start_time,
             "end_time": end_time, "template": template,
             "audio_trimmed": str(job_folder / "audio_trimmed.wav"),
-            "cover_image": str(image_path) if image_path.exists() else None,
+            "cover_image": str(image_path) if has_cover else None,
             "colors": colors, "lyrics_file": str(data_file),
             "beats": beats, "created_at": datetime.now().isoformat(),
         }
         with open(job_folder / "job_data.json", 'w') as f:
-            json.dump(job_data, f, indent=4)
-
-        if not cached and not self.use_smart_picker:
-            self.signals.log.emit("  Saving to database…")
-            self.song_db.add_song(
-                song_title=song_title, youtube_url=youtube_url,
-                start_time=start_time, end_time=end_time,
-                genius_image_url=None, colors=colors, beats=beats)
-        elif cached and not self.use_smart_picker:
-            self.song_db.mark_song_used(song_title)
+            f.write(json.dumps(job_data, separators=_JSON_SEP))
+
         if not self.use_smart_picker:
-            if template == 'aurora':
-                self.song_db.update_lyrics(song_title, lyrics_data)
-            elif template == 'mono':
-                self.song_db.update_mono_lyrics(song_title, lyrics_data)
-            elif template == 'onyx':
-                self.song_db.update_onyx_lyrics(song_title, lyrics_data)
+            # Song row + lyrics column in one transaction
+            with self.song_db.bulk():
+                if not cached:
+                    self.signals.log.emit("  Saving to database…")
+                    self.song_db.add_song(
+                        song_title=song_title, youtube_url=youtube_url,
+                        start_time=start_time, end_time=end_time,
+                        genius_image_url=None, colors=colors, beats=beats)
+                else:
+                    self.song_db.mark_song_used(song_title)
+                if template == 'aurora':
+                    self.song_db.update_lyrics(song_title, lyrics_data)
+                elif template == 'mono':
+                    self.song_db.update_mono_lyrics(song_title, lyrics_data)
+                elif template == 'onyx':
+                    self.song_db.update_onyx_lyrics(song_title, lyrics_data)
 
         self.signals.log.emit(f"  ✓ Job {job_number} complete")
         return (job_data, job_folder) if return_data else None
@@ -1997,10 +2280,17 @@ class AppolovaApp(QMainWindow):
 def main():
     app = QApplication(sys.argv)
     app.setApplicationName("Apollova")
-    app.setStyleSheet(APP_STYLE)
+    app.setStyleSheet(_load_app_style())
     win = AppolovaApp()
     win.show()
-    sys.exit(app.exec())
+    code = app.exec()
+    if QThreadPool.globalInstance().activeThreadCount():
+        # A job is still running (Whisper, AE render wait). QApplication's
+        # teardown would block on it, so end the process the way the old
+        # daemon threads did.
+        logging.shutdown()
+        os._exit(code)
+    sys.exit(code)
 
 
 if __name__ == "__main__":
@@ -2,19 +2,27 @@ import os
 import sys
 import re
 import hashlib
+import functools
 import hmac as _hmac
 import subprocess
+import uuid
 import datetime
+import time
 from pathlib import Path
 
+import base64
 import json as _json
+import threading
+import http.client
 import urllib.request
-import urllib.error
+from urllib.parse import unquote, urlsplit
 
 # Secret is loaded from apollova_secrets.py (gitignored, bundled by PyInstaller).
 # See apollova_secrets.example.py for setup instructions.
 from apollova_secrets import HMAC_SECRET as _HMAC_SECRET_HEX
 _HMAC_SECRET = bytes.fromhex(_HMAC_SECRET_HEX)
+# Keyed once; _compute_token copies it rather than re-deriving the pads
+_HMAC_TEMPLATE = _hmac.new(_HMAC_SECRET, digestmod=hashlib.sha256)
 
 API_BASE = "https://apollova.co.uk/api"
 ENV_FILE = Path(os.environ.get("APPDATA", "")) / "Apollova" / "apollova.env"
@@ -22,20 +30,95 @@ VERIFY_INTERVAL_HOURS = 24
 
 _NO_WINDOW = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
 
+# In-process activation results: sha256(key) -> (ok, message, token, time).
+# Successes are re-checked against the local HMAC before reuse; only
+# definitive server rejections (403/404) are cached as failures.
+_ACTIVATION_OK_TTL   = 24 * 3600
+_ACTIVATION_FAIL_TTL = 60
+_activation_cache: dict[str, tuple[bool, str, str, float]] = {}
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Hardware fingerprinting
 # ─────────────────────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def get_hardware_fingerprint() -> str:
     """
     Return SHA256(motherboard_UUID | USERNAME | COMPUTERNAME).
 
     Uses the exact same data sources and hash as Activator.jsx (certutil SHA256),
-    so the fingerprint is identical on both sides.
+    so the fingerprint is identical on both sides. Computed once per process;
+    deliberately not persisted, so a copied profile re-probes the hardware.
     """
     parts = []
 
     # 1. Motherboard UUID — most stable, tied to hardware
+    board_uuid = _smbios_system_uuid() or _wmic_system_uuid()
+    if board_uuid:
+        parts.append(board_uuid)
+
+    # 2. Windows username
+    parts.append(os.environ.get("USERNAME", "unknown"))
+
+    # 3. Machine hostname
+    parts.append(os.environ.get("COMPUTERNAME", "unknown"))
+
+    raw = "|".join(parts)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _smbios_system_uuid() -> str | None:
+    """
+    System UUID from the SMBIOS System Information (type 1) record, read
+    in-process via GetSystemFirmwareTable and formatted like wmic prints it.
+
+    Returns None whenever wmic might disagree — pre-2.6 tables (ambiguous
+    byte order), all-0/all-F placeholders, or any read failure — so the
+    caller falls back to wmic and the fingerprint still matches Activator.jsx.
+    """
+    if sys.platform != "win32":
+        return None
+    try:
+        import ctypes
+        k32  = ctypes.windll.kernel32
+        rsmb = int.from_bytes(b"RSMB", "big")
+        size = k32.GetSystemFirmwareTable(rsmb, 0, None, 0)
+        if not size:
+            return None
+        buf = ctypes.create_string_buffer(size)
+        if k32.GetSystemFirmwareTable(rsmb, 0, buf, size) != size:
+            return None
+        raw = buf.raw
+    except Exception:
+        return None
+
+    # RawSMBIOSData: calling method, major, minor, DMI rev, DWORD length, table
+    if len(raw) < 8 or (raw[1], raw[2]) < (2, 6):
+        return None
+    table = raw[8:8 + int.from_bytes(raw[4:8], "little")]
+
+    i = 0
+    while i + 4 <= len(table):
+        stype, slen = table[i], table[i + 1]
+        if slen < 4 or stype == 127:            # malformed / end-of-table
+            break
+        if stype == 1:
+            if slen < 0x19:
+                return None
+            value = table[i + 8:i + 24]
+            if value in (b"\x00" * 16, b"\xff" * 16):
+                return None
+            return str(uuid.UUID(bytes_le=value)).upper()
+        # Skip the formatted area, then its string-set (ends in a double NUL)
+        end = table.find(b"\x00\x00", i + slen)
+        if end < 0:
+            break
+        i = end + 2
+    return None
+
+
+def _wmic_system_uuid() -> str | None:
+    """The same UUID via `wmic csproduct get uuid` (spawns a process)."""
     try:
         r = subprocess.run(
             ["wmic", "csproduct", "get", "uuid"],
@@ -45,18 +128,10 @@ def get_hardware_fingerprint() -> str:
         lines = [ln.strip() for ln in r.stdout.strip().splitlines()]
         # Line 0 = "UUID" header, line 1 = actual UUID value
         if len(lines) >= 2 and lines[1] and lines[1].lower() != "uuid":
-            parts.append(lines[1])
+            return lines[1]
     except Exception:
         pass
-
-    # 2. Windows username
-    parts.append(os.environ.get("USERNAME", "unknown"))
-
-    # 3. Machine hostname
-    parts.append(os.environ.get("COMPUTERNAME", "unknown"))
-
-    raw = "|".join(parts)
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    return None
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -116,11 +191,9 @@ def delete_license() -> None:
 # ─────────────────────────────────────────────────────────────────────────────
 
 def _compute_token(license_key: str, hw_fingerprint: str) -> str:
-    return _hmac.new(
-        _HMAC_SECRET,
-        f"{license_key}:{hw_fingerprint}".encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
+    h = _HMAC_TEMPLATE.copy()
+    h.update(f"{license_key}:{hw_fingerprint}".encode("utf-8"))
+    return h.hexdigest()
 
 
 def _verify_token_local(token: str, license_key: str, hw_fingerprint: str) -> bool:
@@ -141,27 +214,71 @@ def _needs_server_verify(env: dict) -> bool:
 # Server calls
 # ─────────────────────────────────────────────────────────────────────────────
 
+_API = urlsplit(API_BASE)
+_conn: http.client.HTTPSConnection | None = None
+_conn_lock = threading.Lock()
+_STALE_SOCKET_ERRORS = (BrokenPipeError, ConnectionResetError, ConnectionAbortedError)
+
+
+def _new_connection(timeout: float) -> http.client.HTTPSConnection:
+    """HTTPS connection to the API host, tunnelled through the system proxy if set."""
+    host, port = _API.hostname, _API.port or 443
+    proxy = urllib.request.getproxies().get("https")
+    if proxy and not urllib.request.proxy_bypass(host):
+        p = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+        conn = http.client.HTTPSConnection(p.hostname, p.port or 8080,
+                                           timeout=timeout)
+        tunnel_headers = None
+        if p.username:
+            # urlopen sent proxy credentials from the URL; keep doing so
+            creds = f"{unquote(p.username)}:{unquote(p.password or '')}"
+            tunnel_headers = {"Proxy-Authorization": "Basic " + base64.b64encode(
+                creds.encode("utf-8")).decode("ascii")}
+        conn.set_tunnel(host, port, headers=tunnel_headers)
+        return conn
+    return http.client.HTTPSConnection(host, port, timeout=timeout)
+
+
 def _post(endpoint: str, payload: dict) -> tuple[int, dict]:
+    """
+    POST JSON to the API over a kept-alive connection, so activation retries
+    and the verify call skip the TCP + TLS handshake. A reused socket the
+    server has since closed is reopened once.
+    """
+    global _conn
     data = _json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        f"{API_BASE}/{endpoint}",
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
+    headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+    with _conn_lock:
+        while True:
+            reused = _conn is not None
+            if _conn is None:
+                _conn = _new_connection(timeout=15)
+            sent = False
             try:
-                body = _json.loads(resp.read().decode("utf-8"))
+                _conn.request("POST", f"{_API.path}/{endpoint}",
+                              body=data, headers=headers)
+                sent = True
+                resp = _conn.getresponse()
+                raw = resp.read()
+            except (http.client.HTTPException, OSError) as e:
+                _conn.close()
+                _conn = None
+                # Only a keep-alive socket the server already closed is
+                # safe to retry: the send failed, or the server hung up
+                # without a byte of response. Timeouts and anything after
+                # the POST may have been processed propagate (no re-send).
+                if reused and (isinstance(e, http.client.RemoteDisconnected)
+                               or (not sent and isinstance(e, _STALE_SOCKET_ERRORS))):
+                    continue
+                raise
+            if resp.will_close:
+                _conn.close()
+                _conn = None
+            try:
+                body = _json.loads(raw.decode("utf-8"))
             except Exception:
                 body = {}
-            return resp.status, body
-    except urllib.error.HTTPError as e:
-        try:
-            body = _json.loads(e.read().decode("utf-8"))
-        except Exception:
-            body = {}
-        return e.code, body
+            return resp.status, body if isinstance(body, dict) else {}
 
 
 def _server_verify(license_key: str, hw_fingerprint: str) -> tuple[bool, str, str]:
@@ -174,7 +291,7 @@ def _server_verify(license_key: str, hw_fingerprint: str) -> tuple[bool, str, st
             "licenseKey": license_key,
             "hwFingerprint": hw_fingerprint,
         })
-    except (urllib.error.URLError, OSError, TimeoutError):
+    except (http.client.HTTPException, OSError):
         return True, "offline", ""
     except Exception:
         return True, "offline", ""
@@ -239,12 +356,25 @@ def activate_license(license_key: str) -> tuple[bool, str]:
 
     hw_fingerprint = get_hardware_fingerprint()
 
+    key_hash = hashlib.sha256(license_key.encode("utf-8")).hexdigest()
+    cached = _activation_cache.get(key_hash)
+    if cached:
+        ok, message, token, ts = cached
+        ttl = _ACTIVATION_OK_TTL if ok else _ACTIVATION_FAIL_TTL
+        if time.monotonic() - ts < ttl:
+            if not ok:
+                return False, message
+            if _verify_token_local(token, license_key, hw_fingerprint):
+                _save_env(license_key, hw_fingerprint, token)
+                return True, message
+        _activation_cache.pop(key_hash, None)
+
     try:
         status, body = _post("activate", {
             "licenseKey": license_key,
             "hwFingerprint": hw_fingerprint,
         })
-    except (urllib.error.URLError, OSError, TimeoutError):
+    except (http.client.HTTPException, OSError):
         return False, (
             "Cannot connect to the activation server.\n"
             "Please check your internet connection and try again."
@@ -257,18 +387,24 @@ def activate_license(license_key: str) -> tuple[bool, str]:
         if not token:
             return False, "Server returned an invalid response.\nPlease contact support@apollova.co.uk"
         _save_env(license_key, hw_fingerprint, token)
-        return True, body.get("message", "License activated successfully!")
+        message = body.get("message", "License activated successfully!")
+        _activation_cache[key_hash] = (True, message, token, time.monotonic())
+        return True, message
 
     err = body.get("error", "")
+    message = None
     if status == 404:
-        return False, "License key not found.\nPlease double-check your key and try again."
-    if status == 403:
+        message = "License key not found.\nPlease double-check your key and try again."
+    elif status == 403:
         if "revoked" in err.lower():
-            return False, "This license has been revoked.\nPlease contact support@apollova.co.uk"
-        if "another" in err.lower() or "hardware" in err.lower():
-            return False, (
+            message = "This license has been revoked.\nPlease contact support@apollova.co.uk"
+        elif "another" in err.lower() or "hardware" in err.lower():
+            message = (
                 "This license is already activated on another computer.\n\n"
                 "If you recently upgraded your PC, contact support@apollova.co.uk\n"
                 "to reset your license binding."
             )
+    if message:
+        _activation_cache[key_hash] = (False, message, "", time.monotonic())
+        return False, message
     return False, err or f"Activation failed (HTTP {status}). Please try again."
@@ -20,9 +20,11 @@ Usage:
 """
 
 import logging
+import logging.handlers
 import os
 import sys
 import platform
+import time
 import traceback
 from datetime import datetime
 from pathlib import Path
@@ -31,6 +33,7 @@ from pathlib import Path
 MAX_LOG_BYTES = 5 * 1024 * 1024   # 5 MB before rotation
 MAX_LOG_BACKUPS = 3               # keep .log.1, .log.2, .log.3
 LOG_NAMES = ("setup", "app", "uninstall")
+LOG_BUFFER_RECORDS = 512          # records held before a write; WARNING+ flushes
 
 
 # ── Resolve log directory ──────────────────────────────────────────────────────
@@ -87,10 +90,17 @@ class _Formatter(logging.Formatter):
         logging.CRITICAL: "FATAL  ",
     }
 
+    # (whole second, "[YYYY-mm-dd HH:MM:SS]") — bursts share one strftime
+    _last_ts = (None, "")
+
     def format(self, record: logging.LogRecord) -> str:
         icon = self.LEVEL_ICONS.get(record.levelno, "INFO   ")
-        ts   = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
-        base = f"[{ts}] {icon}  {record.getMessage()}"
+        sec  = int(record.created)
+        last_sec, ts = self._last_ts
+        if sec != last_sec:
+            ts = time.strftime("[%Y-%m-%d %H:%M:%S]", time.localtime(sec))
+            self._last_ts = (sec, ts)
+        base = f"{ts} {icon}  {record.getMessage()}"
         if record.exc_info:
             base += "\n" + self.formatException(record.exc_info)
         return base
@@ -107,12 +117,22 @@ class ApollovaLogger:
         self._logger.handlers.clear()
         self._logger.propagate = False
 
-        # File handler
+        # File handler behind a memory buffer, so a busy job batch costs one
+        # write per LOG_BUFFER_RECORDS lines instead of one per line. Warnings,
+        # errors and section() markers flush immediately, so the context
+        # before a problem (or a hard qFatal abort) is already on disk;
+        # logging.shutdown() flushes the rest at exit.
+        # Rotation stays a once-at-open pass (get_logger): app.log is held
+        # open by both the launcher and the GUI, and a mid-session rename
+        # fails on Windows while the other process has it open.
+        self._buffer = None
         try:
             fh = logging.FileHandler(str(log_path), encoding="utf-8")
             fh.setLevel(logging.DEBUG)
             fh.setFormatter(_Formatter())
-            self._logger.addHandler(fh)
+            self._buffer = logging.handlers.MemoryHandler(
+                LOG_BUFFER_RECORDS, flushLevel=logging.WARNING, target=fh)
+            self._logger.addHandler(self._buffer)
         except Exception as e:
             # If we can't write logs, don't crash the app
             print(f"[apollova_logger] Could not open log file {log_path}: {e}",
@@ -134,6 +154,7 @@ class ApollovaLogger:
         """Write a visual separator line — makes log easy to scan."""
         sep = "─" * 60
         self._logger.info(f"\n{sep}\n  {title}\n{sep}")
+        self.flush()
 
     def session_start(self, component: str):
         """Write a session header — called once when the app/installer opens."""
@@ -150,6 +171,11 @@ class ApollovaLogger:
         outcome = "COMPLETED SUCCESSFULLY" if success else "ENDED WITH ERRORS"
         self.section(f"{component} session {outcome}")
 
+    def flush(self):
+        """Write any buffered records to the log file now."""
+        if self._buffer is not None:
+            self._buffer.flush()
+
     def cmd_result(self, cmd: list | str, returncode: int,
                    stdout: str = "", stderr: str = ""):
         """Log the result of a subprocess call."""
@@ -20,11 +20,15 @@ class Config:
     # API Settings
     GENIUS_API_TOKEN = os.getenv("GENIUS_API_TOKEN", "")
     GENIUS_BASE_URL = "https://api.genius.com"
+    # Cleaned Genius lyrics, one file per song (next to the song database)
+    GENIUS_CACHE_DIR = str(_BASE_DIR / "database" / "genius_cache")
 
     # Whisper Settings
     WHISPER_MODEL = os.getenv("WHISPER_MODEL", "small")
     # Absolute path so models always land in the right place regardless of cwd
     WHISPER_CACHE_DIR = str(_BASE_DIR / "whisper_models")
+    # "auto" uses faster-whisper when installed; "openai" forces openai-whisper
+    WHISPER_BACKEND = os.getenv("WHISPER_BACKEND", "auto").lower()
     
     # Job Settings
     TOTAL_JOBS = int(os.getenv("TOTAL_JOBS", "12"))
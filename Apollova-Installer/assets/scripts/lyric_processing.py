@@ -154,7 +154,7 @@ def transcribe_audio(job_folder, song_title=None):
 
         lyrics_path = os.path.join(job_folder, "lyrics.txt")
         with open(lyrics_path, "w", encoding="utf-8") as f:
-            json.dump(segments, f, indent=4, ensure_ascii=False)
+            json.dump(segments, f, separators=(",", ":"), ensure_ascii=False)
 
         print(f"\u2713 Transcription complete: {len(segments)} segments")
         return lyrics_path
@@ -938,6 +938,7 @@ class SetupWizard(QMainWindow):
         """Check all required asset files exist."""
         required = [
             self.assets_dir / "apollova_gui.py",
+            self.assets_dir / "apollova.qss",
             self.assets_dir / "scripts" / "config.py",
             self.assets_dir / "scripts" / "audio_processing.py",
             self.assets_dir / "scripts" / "image_processing.py",
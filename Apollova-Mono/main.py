@@ -13,7 +13,7 @@ from rich.console import Console
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from scripts.config import Config
-from scripts.audio_processing import download_audio, trim_audio
+from scripts.audio_processing import download_audio, trim_audio, find_audio_source
 from scripts.lyric_processing_mono import transcribe_audio_mono
 from scripts.song_database import SongDatabase
 
@@ -30,7 +30,7 @@ Config.set_max_line_length(40)
 def check_job_progress(job_folder):
     """Check which stages are already complete"""
     stages = {
-        "audio_downloaded": os.path.exists(os.path.join(job_folder, "audio_source.mp3")),
+        "audio_downloaded": find_audio_source(job_folder) is not None,
         "audio_trimmed": os.path.exists(os.path.join(job_folder, "audio_trimmed.wav")),
         "mono_data_generated": os.path.exists(os.path.join(job_folder, "mono_data.json")),
         "job_complete": os.path.exists(os.path.join(job_folder, "job_data.json"))
@@ -105,7 +105,7 @@ def process_single_job(job_id):
             console.print(f"[red]Failed to download audio: {e}[/red]")
             return False
     else:
-        audio_path = os.path.join(job_folder, "audio_source.mp3")
+        audio_path = find_audio_source(job_folder)
         console.print("✓ Audio already downloaded")
         audio_url = cached_song["youtube_url"] if cached_song else job_data.get("youtube_url", "unknown")
     
@@ -13,7 +13,7 @@ from rich.console import Console
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from scripts.config import Config
-from scripts.audio_processing import download_audio, trim_audio
+from scripts.audio_processing import download_audio, trim_audio, find_audio_source
 from scripts.image_processing import download_image, extract_colors
 from scripts.lyric_processing_onyx import transcribe_audio_onyx
 from scripts.genius_processing import fetch_genius_image
@@ -29,7 +29,7 @@ song_db = SongDatabase(db_path=str(SHARED_DB))
 def check_job_progress(job_folder):
     """Check which stages are already complete"""
     stages = {
-        "audio_downloaded": os.path.exists(os.path.join(job_folder, "audio_source.mp3")),
+        "audio_downloaded": find_audio_source(job_folder) is not None,
         "audio_trimmed": os.path.exists(os.path.join(job_folder, "audio_trimmed.wav")),
         "onyx_data_created": os.path.exists(os.path.join(job_folder, "onyx_data.json")),
         "image_downloaded": os.path.exists(os.path.join(job_folder, "cover.png")),
@@ -110,7 +110,7 @@ def process_single_job(job_id):
             console.print(f"[red]Failed to download audio: {e}[/red]")
             return False
     else:
-        audio_path = os.path.join(job_folder, "audio_source.mp3")
+        audio_path = find_audio_source(job_folder)
         console.print("✓ Audio already downloaded")
         audio_url = cached_song["youtube_url"] if cached_song else job_data.get("youtube_url", "unknown")
     
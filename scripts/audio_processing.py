@@ -2,12 +2,14 @@
 Audio Processing - Download, trim, and beat detection
 Shared across Aurora, Mono, and Onyx templates
 
-- download_audio: YouTube download via yt-dlp
+- download_audio: YouTube download via yt-dlp (stream kept in its own container)
 - trim_audio: Clip extraction based on MM:SS timestamps
+- download_audio_section: Download + trim in one step (only the clip is fetched)
 - detect_beats: Beat detection via librosa (Aurora only)
 """
 import os
 import re
+import sys
 import time
 import subprocess
 import yt_dlp
@@ -15,6 +17,8 @@ from pydub import AudioSegment
 
 _YT_ID_RE = re.compile(r'(?:youtube\.com/watch\?.*v=|youtu\.be/)([A-Za-z0-9_-]{11})')
 
+_NO_WINDOW = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+
 
 def _validate_youtube_url(url):
     """Raise a user-friendly ValueError if the URL is not a valid YouTube video link."""
@@ -42,13 +46,38 @@ def _validate_youtube_url(url):
         )
 
 
-def download_audio(url, job_folder, max_retries=3, use_oauth=True):
-    """Download audio from YouTube URL using yt-dlp"""
+def find_audio_source(job_folder):
+    """
+    Path of the job's downloaded audio, or None.
+    Older jobs have audio_source.mp3; newer ones keep YouTube's own
+    container (audio_source.m4a / .webm / ...).
+    """
     mp3_path = os.path.join(job_folder, 'audio_source.mp3')
-
     if os.path.exists(mp3_path):
-        print(f"✓ Audio already downloaded")
         return mp3_path
+    try:
+        with os.scandir(job_folder) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith('audio_source.') and not name.endswith(('.part', '.ytdl')):
+                    return entry.path
+    except OSError:
+        pass
+    return None
+
+
+def download_audio(url, job_folder, max_retries=3, use_oauth=True):
+    """
+    Download audio from YouTube URL using yt-dlp.
+
+    The stream is saved as-is (audio_source.<ext>) rather than re-encoded to
+    MP3: trim_audio decodes it with ffmpeg either way, so the libmp3lame pass
+    only cost time and quality.
+    """
+    existing = find_audio_source(job_folder)
+    if existing:
+        print(f"✓ Audio already downloaded")
+        return existing
 
     _validate_youtube_url(url)
     print(f"Downloading audio...")
@@ -58,11 +87,6 @@ def download_audio(url, job_folder, max_retries=3, use_oauth=True):
     ydl_opts = {
         'format': 'bestaudio/best',
         'outtmpl': temp_base + '.%(ext)s',
-        'postprocessors': [{
-            'key': 'FFmpegExtractAudio',
-            'preferredcodec': 'mp3',
-            'preferredquality': '2',
-        }],
         'quiet': True,
         'no_warnings': True,
         'retries': max_retries,
@@ -73,15 +97,21 @@ def download_audio(url, job_folder, max_retries=3, use_oauth=True):
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 ydl.download([url])
 
-            temp_mp3 = temp_base + '.mp3'
-            if os.path.exists(temp_mp3):
-                os.rename(temp_mp3, mp3_path)
+            audio_path = None
+            with os.scandir(job_folder) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith('yt_temp.') and not name.endswith(('.part', '.ytdl')):
+                        ext = os.path.splitext(name)[1]
+                        audio_path = os.path.join(job_folder, 'audio_source' + ext)
+                        os.replace(entry.path, audio_path)
+                        break
 
-            if os.path.exists(mp3_path):
+            if audio_path:
                 print(f"✓ Audio downloaded")
-                return mp3_path
+                return audio_path
             else:
-                raise Exception("MP3 file not found after download")
+                raise Exception("Audio file not found after download")
 
         except Exception as e:
             error_msg = str(e).lower()
@@ -104,6 +134,74 @@ def download_audio(url, job_folder, max_retries=3, use_oauth=True):
     return None
 
 
+def download_audio_section(url, job_folder, start_time, end_time, max_retries=3):
+    """
+    Download only [start_time, end_time] (MM:SS) of the audio straight to
+    audio_trimmed.wav — one fetch + one ffmpeg pass instead of downloading
+    the whole song and trimming it. The clip keeps its source sample rate
+    and channels (it is the After Effects soundtrack).
+    """
+    trimmed_path = os.path.join(job_folder, "audio_trimmed.wav")
+    if os.path.exists(trimmed_path):
+        return trimmed_path
+
+    _validate_youtube_url(url)
+    start_ms = mmss_to_milliseconds(start_time)
+    end_ms = mmss_to_milliseconds(end_time)
+    if start_ms >= end_ms:
+        raise ValueError("Start time must be before end time")
+
+    temp_base = os.path.join(job_folder, 'yt_clip')
+    ydl_opts = {
+        'format': 'bestaudio/best',
+        'outtmpl': temp_base + '.%(ext)s',
+        'download_ranges': yt_dlp.utils.download_range_func(
+            None, [(start_ms / 1000, end_ms / 1000)]),
+        'postprocessors': [{
+            'key': 'FFmpegExtractAudio',
+            'preferredcodec': 'wav',
+        }],
+        'quiet': True,
+        'no_warnings': True,
+        'retries': max_retries,
+    }
+
+    for attempt in range(max_retries):
+        try:
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                ydl.download([url])
+            if not os.path.exists(temp_base + '.wav'):
+                raise Exception("WAV clip not found after download")
+            os.replace(temp_base + '.wav', trimmed_path)
+            print(f"✓ Clip downloaded: {(end_ms - start_ms) / 1000:.1f}s")
+            return trimmed_path
+        except Exception as e:
+            if attempt < max_retries - 1:
+                print(f"  Clip download failed (attempt {attempt + 1}/{max_retries}), retrying...")
+                time.sleep(2)
+                continue
+            print(f"❌ Clip download failed after {max_retries} attempts: {e}")
+            # Leave the folder clean for a full-download fallback
+            _remove_prefixed(job_folder, 'yt_clip.')
+            raise
+
+    return None
+
+
+def _remove_prefixed(job_folder, prefix):
+    """Delete leftovers (partial downloads, .part/.ytdl files) named prefix*"""
+    try:
+        with os.scandir(job_folder) as it:
+            for entry in it:
+                if entry.name.startswith(prefix):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+    except OSError:
+        pass
+
+
 def mmss_to_milliseconds(time_str):
     """Convert MM:SS to milliseconds"""
     try:
@@ -120,15 +218,13 @@ def mmss_to_milliseconds(time_str):
 
 def trim_audio(job_folder, start_time, end_time):
     """Trim audio file to specified timestamps (MM:SS format)"""
-    audio_path = os.path.join(job_folder, 'audio_source.mp3')
+    audio_path = find_audio_source(job_folder)
     
-    if not os.path.exists(audio_path):
-        print(f"❌ Audio source not found: {audio_path}")
+    if not audio_path:
+        print(f"❌ Audio source not found in {job_folder}")
         return None
     
     try:
-        song = AudioSegment.from_file(audio_path, format="mp3")
-        
         start_ms = mmss_to_milliseconds(start_time)
         end_ms = mmss_to_milliseconds(end_time)
         
@@ -136,10 +232,19 @@ def trim_audio(job_folder, start_time, end_time):
             print("❌ Start time must be before end time")
             return None
         
-        clip = song[start_ms:end_ms]
-        
+        # One ffmpeg pass: seek the source (-ss before -i) and decode only the
+        # clip to 16-bit PCM. Sample rate and channels are kept — this WAV is
+        # the soundtrack After Effects renders, not just Whisper's input.
         export_path = os.path.join(job_folder, "audio_trimmed.wav")
-        clip.export(export_path, format="wav")
+        r = subprocess.run(
+            [AudioSegment.converter, "-y", "-loglevel", "error",
+             "-ss", f"{start_ms / 1000:.3f}", "-i", audio_path,
+             "-t", f"{(end_ms - start_ms) / 1000:.3f}",
+             "-vn", "-acodec", "pcm_s16le", export_path],
+            capture_output=True, text=True, creationflags=_NO_WINDOW,
+        )
+        if r.returncode != 0:
+            raise RuntimeError(f"ffmpeg exited {r.returncode}: {r.stderr.strip()[-300:]}")
         
         duration = (end_ms - start_ms) / 1000
         print(f"✓ Trimmed audio: {duration:.1f}s clip created")
@@ -157,6 +262,7 @@ def detect_beats(job_folder):
     Used by Aurora for beat-synced effects. Mono/Onyx don't need this.
     """
     import librosa
+    import soundfile as sf
     
     audio_path = os.path.join(job_folder, "audio_trimmed.wav")
     
@@ -165,7 +271,11 @@ def detect_beats(job_folder):
         return []
     
     try:
-        y, sr = librosa.load(audio_path, sr=None)
+        # Read the WAV straight through libsndfile (what librosa.load does
+        # underneath, minus its resampling/audioread fallback layers)
+        y, sr = sf.read(audio_path, dtype="float32")
+        if y.ndim > 1:
+            y = y.mean(axis=1)
         
         tempo, beat_frames = librosa.beat.beat_track(y=y, sr=sr)
         beat_times = librosa.frames_to_time(beat_frames, sr=sr)
@@ -28,10 +28,15 @@ class Config:
     # API Settings
     GENIUS_API_TOKEN = os.getenv("GENIUS_API_TOKEN", "")
     GENIUS_BASE_URL = "https://api.genius.com"
+    # Cleaned Genius lyrics, one file per song (next to the song database)
+    GENIUS_CACHE_DIR = os.getenv(
+        "GENIUS_CACHE_DIR", str(_project_root / "database" / "genius_cache"))
     
     # Whisper Settings
     WHISPER_MODEL = os.getenv("WHISPER_MODEL", "small")
     WHISPER_CACHE_DIR = os.getenv("WHISPER_CACHE_DIR", "whisper_models")
+    # "auto" uses faster-whisper when installed; "openai" forces openai-whisper
+    WHISPER_BACKEND = os.getenv("WHISPER_BACKEND", "auto").lower()
     
     # Job Settings
     TOTAL_JOBS = int(os.getenv("TOTAL_JOBS", "12"))
@@ -4,16 +4,23 @@ Shared across Aurora, Mono, and Onyx templates
 
 Extraction strategy (triple-layer):
   1. __PRELOADED_STATE__ JSON (fastest, most reliable when available)
-  2. BeautifulSoup HTML parsing (data-lyrics-container divs)
+  2. HTML parsing of data-lyrics-container divs (lxml when installed,
+     BeautifulSoup otherwise)
   3. Regex fallback (last resort for unusual page structures)
 """
+import hashlib
+import os
 import random
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import requests
 import re
 import json
 from html import unescape
+from requests.adapters import HTTPAdapter
 
 try:
     from bs4 import BeautifulSoup
@@ -23,6 +30,12 @@ except ImportError:
     print("  ⚠ beautifulsoup4 not installed. Install with: pip install beautifulsoup4")
     print("    Falling back to regex-based extraction (less reliable)")
 
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False  # optional: C parser, BeautifulSoup covers the same step
+
 from scripts.config import Config
 
 
@@ -47,6 +60,62 @@ def _browser_headers():
     }
 
 
+# ============================================================================
+# Regexes used per page / per line, compiled once
+# ============================================================================
+# (pattern, is_js_string) — JSON.parse('...') captures need unescaping first.
+# Matched only at a marker occurrence, and at most _PRELOADED_STATE_SPAN chars
+# past it, so a page without the state never runs the DOTALL scans.
+_PRELOADED_STATE_MARKER = "window.__PRELOADED_STATE__"
+_PRELOADED_STATE_SPAN = 2_000_000
+_PRELOADED_STATE_PATTERNS = [
+    (re.compile(r'window\.__PRELOADED_STATE__\s*=\s*JSON\.parse\(([\'"])(?P<raw>.*?)\1\);', re.DOTALL), True),
+    (re.compile(r'window\.__PRELOADED_STATE__\s*=\s*(?P<raw>\{.*?\})\s*;', re.DOTALL), False),
+]
+# A double quote not escaped by a backslash (an even run of them may precede it)
+_BARE_DQUOTE_RE = re.compile(r'(?<!\\)((?:\\\\)*)"')
+_LYRICS_CONTAINER_CLASS_RE = re.compile(r"Lyrics__Container")
+_LYRICS_CLASS_RE = re.compile(r"lyrics")
+_CONTAINER_DIV_RE = re.compile(
+    r'<div[^>]+data-lyrics-container="true"[^>]*>(.*?)</div>', re.DOTALL | re.IGNORECASE)
+_CONTAINER_CLASS_DIV_RE = re.compile(
+    r'<div[^>]+class="[^"]*Lyrics__Container[^"]*"[^>]*>(.*?)</div>', re.DOTALL | re.IGNORECASE)
+_BR_RE = re.compile(r'<br\s*/?>')
+_TAG_RE = re.compile(r'<.*?>', re.DOTALL)
+_MULTI_BLANK_RE = re.compile(r'\n{3,}')
+
+# Translation indicators in Genius result titles / artist names
+_TRANSLATION_RE = re.compile("|".join(map(re.escape, (
+    "türkçe çeviri", "tradução", "traduction", "traducción",
+    "перевод", "översättning", "übersetzung", "terjemahan",
+    "翻訳", "번역", "traduzione", "vertaling",
+    "genius türkçe", "genius brasil", "genius traductions",
+    "genius traducciones", "genius traduções",
+))))
+
+# Metadata/junk lines dropped by _clean_lyrics (matched on the lowercased
+# line). One alternation so each line costs a single search; every branch
+# keeps its own anchors.
+_SKIP_RE = re.compile("|".join((
+    "contributors",
+    "translations",
+    "embed",
+    "you might also like",
+    r"^see\s+.*\s+live\s*$",  # #6: Anchored — only whole-line "See X Live"
+    r"^\d+$",                  # Just numbers
+    r"^\s*genius\s*$",         # #6: Whole-line only — don't strip lyrics containing "genius"
+)))
+
+
+# ============================================================================
+# Shared HTTP session: api.genius.com searches and genius.com page fetches
+# reuse kept-alive connections instead of a TCP + TLS handshake per call.
+# Headers stay per-request (the token can change between batches).
+# ============================================================================
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
 # ============================================================================
 # #15: Retry helper for Genius API requests
 # ============================================================================
@@ -59,11 +128,12 @@ def _request_with_retry(method, url, retries=2, backoff=1.0, **kwargs):
     last_exc = None
     for attempt in range(1 + retries):
         try:
-            resp = requests.request(method, url, **kwargs)
+            resp = _SESSION.request(method, url, **kwargs)
             if resp.status_code < 500:
                 return resp
-            # 5xx — retry
+            # 5xx — retry; release the connection (stream=True leaves it held)
             last_exc = requests.HTTPError(f"HTTP {resp.status_code}")
+            resp.close()
         except (requests.ConnectionError, requests.Timeout) as e:
             last_exc = e
         if attempt < retries:
@@ -71,6 +141,49 @@ def _request_with_retry(method, url, retries=2, backoff=1.0, **kwargs):
     raise last_exc
 
 
+# ============================================================================
+# Shared /search results: the cover fetch and the lyrics fetch both search
+# "<title> <artist>" for the same song. The first caller does the request,
+# a concurrent or later caller waits on / reuses its result. Failures are
+# not kept, so the next caller retries.
+# ============================================================================
+_SEARCH_CACHE_SIZE = 32
+_search_cache = OrderedDict()
+_search_lock = threading.Lock()
+
+
+def _search_hits(query, headers):
+    """GET /search?q=query and return the hits list (shared per query)"""
+    key = (query, headers.get("Authorization"))
+    with _search_lock:
+        future = _search_cache.get(key)
+        owner = future is None
+        if owner:
+            future = Future()
+            _search_cache[key] = future
+            while len(_search_cache) > _SEARCH_CACHE_SIZE:
+                _search_cache.popitem(last=False)
+        else:
+            _search_cache.move_to_end(key)
+    
+    if owner:
+        try:
+            response = _request_with_retry(
+                "GET", f"{Config.GENIUS_BASE_URL}/search",
+                params={"q": query},
+                headers=headers,
+            )
+            response.raise_for_status()
+            future.set_result(response.json().get("response", {}).get("hits", []))
+        except Exception as e:
+            with _search_lock:
+                if _search_cache.get(key) is future:
+                    del _search_cache[key]
+            future.set_exception(e)
+    
+    return future.result()
+
+
 # ============================================================================
 # PUBLIC API: fetch_genius_image
 # ============================================================================
@@ -87,18 +200,11 @@ def fetch_genius_image(song_title, job_folder):
     query = f"{title} {artist}" if artist else title
     
     try:
-        response = _request_with_retry(
-            "GET", f"{Config.GENIUS_BASE_URL}/search",
-            params={"q": query},
-            headers=headers,
-        )
-        response.raise_for_status()
-        data = response.json()
+        hits = _search_hits(query, headers)
     except Exception as e:
         print(f"  Genius image search failed: {e}")
         return None
     
-    hits = data.get("response", {}).get("hits", [])
     if not hits:
         print("  No Genius results found for image")
         return None
@@ -133,6 +239,12 @@ def fetch_genius_lyrics(song_title):
     if not Config.GENIUS_API_TOKEN or not song_title:
         return None
     
+    cached = _read_cached_lyrics(song_title)
+    if cached:
+        line_count = len([l for l in cached.splitlines() if l.strip()])
+        print(f"  ✓ Genius lyrics (cached): {line_count} lines")
+        return cached
+    
     headers = {"Authorization": f"Bearer {Config.GENIUS_API_TOKEN}"}
     artist, title = _parse_song_title(song_title)
     
@@ -143,26 +255,26 @@ def fetch_genius_lyrics(song_title):
         queries.append(f"{artist} {title}")
     queries.append(title)
     
+    # All queries go out at once; results are still taken in query order so
+    # the first query with hits wins, exactly as the sequential loop did.
     url = None
-    for query in queries:
-        try:
-            response = _request_with_retry(
-                "GET", f"{Config.GENIUS_BASE_URL}/search",
-                params={"q": query},
-                headers=headers,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            hits = data.get("response", {}).get("hits", [])
+    pool = ThreadPoolExecutor(max_workers=len(queries))
+    try:
+        futures = [(query, pool.submit(_search_hits, query, headers)) for query in queries]
+        for query, future in futures:
+            try:
+                hits = future.result()
+            except Exception as e:
+                print(f"  Genius search failed for '{query}': {e}")
+                continue
             if hits:
                 best_hit = _find_best_hit(hits, artist, title)
                 url = best_hit["result"]["url"]
                 print(f"  Genius match: {best_hit['result'].get('full_title', 'Unknown')}")
                 break
-        except Exception as e:
-            print(f"  Genius search failed for '{query}': {e}")
-            continue
+    finally:
+        # Don't wait on slower fallback queries once a match is in hand
+        pool.shutdown(wait=False, cancel_futures=True)
     
     if not url:
         print("  No Genius results found")
@@ -170,16 +282,21 @@ def fetch_genius_lyrics(song_title):
     
     # Fetch lyrics page with rotating browser headers (#16)
     try:
-        html = _request_with_retry("GET", url, headers=_browser_headers(), timeout=15).text
+        html, lyrics = _fetch_lyrics_page(url)
     except Exception as e:
         print(f"  Failed to fetch Genius page: {e}")
         return None
     
-    # Triple-layer extraction
-    lyrics = _extract_from_preloaded_state(html)
+    # Triple-layer extraction (Method 1 may already have succeeded mid-download)
+    if not lyrics:
+        lyrics = _extract_from_preloaded_state(html)
+    
+    if not lyrics and HAS_LXML:
+        print("  Method 1 (JSON) failed, trying lxml...")
+        lyrics = _extract_with_lxml(html)
     
     if not lyrics:
-        print("  Method 1 (JSON) failed, trying BeautifulSoup...")
+        print("  Trying BeautifulSoup...")
         lyrics = _extract_with_beautifulsoup(html)
     
     if not lyrics:
@@ -196,35 +313,114 @@ def fetch_genius_lyrics(song_title):
     if lyrics:
         line_count = len([l for l in lyrics.splitlines() if l.strip()])
         print(f"  ✓ Genius lyrics fetched: {line_count} lines")
+        _write_cached_lyrics(song_title, lyrics)
     
     return lyrics
 
 
+# ============================================================================
+# Lyrics page download: the preloaded state sits well before the end of a
+# ~0.5-1 MB page, so stream it and stop once Method 1 has what it needs
+# ============================================================================
+_PAGE_CHUNK_SIZE = 64 * 1024
+_PRELOADED_STATE_ENDS = (b"');", b'");', b"};")
+
+
+def _fetch_lyrics_page(url):
+    """
+    Download a Genius song page.
+    
+    Returns (html, lyrics). As soon as the streamed prefix holds the
+    __PRELOADED_STATE__ marker and a closing terminator, Method 1 runs on
+    that prefix; if it yields lyrics the rest of the page is skipped and
+    (None, lyrics) is returned. Otherwise the full page comes back as
+    (html, None) for the usual extraction chain.
+    """
+    marker = _PRELOADED_STATE_MARKER.encode("ascii")
+    with _request_with_retry("GET", url, headers=_browser_headers(),
+                             timeout=15, stream=True) as resp:
+        encoding = resp.encoding or "utf-8"
+        buf = bytearray()
+        state_at = -1
+        tried = False
+        for chunk in resp.iter_content(chunk_size=_PAGE_CHUNK_SIZE):
+            # Re-scan a few bytes of the previous chunk: a marker or
+            # terminator may straddle the chunk boundary
+            scan_from = max(0, len(buf) - len(marker))
+            buf += chunk
+            if tried:
+                continue
+            if state_at < 0:
+                state_at = buf.find(marker, scan_from)
+                if state_at < 0:
+                    continue
+                scan_from = state_at
+            if any(buf.find(end, scan_from) >= 0 for end in _PRELOADED_STATE_ENDS):
+                tried = True
+                lyrics = _extract_from_preloaded_state(buf.decode(encoding, "replace"))
+                if lyrics:
+                    return None, lyrics
+        
+        return buf.decode(encoding, "replace"), None
+
+
+# ============================================================================
+# Lyrics disk cache: re-runs of a song skip search + page fetch + extraction
+# ============================================================================
+_LYRICS_CACHE_TTL = 30 * 86400  # seconds; Genius pages do get corrected
+
+
+def _lyrics_cache_path(song_title):
+    """Cache file for a song, keyed by normalized (artist, title)"""
+    artist, title = _parse_song_title(song_title)
+    key = " - ".join(" ".join(part.lower().split()) for part in (artist or "", title))
+    name = hashlib.sha1(key.encode("utf-8")).hexdigest() + ".txt"
+    return os.path.join(Config.GENIUS_CACHE_DIR, name)
+
+
+def _read_cached_lyrics(song_title):
+    """Return cached lyrics if present and fresh, else None"""
+    path = _lyrics_cache_path(song_title)
+    try:
+        if time.time() - os.path.getmtime(path) > _LYRICS_CACHE_TTL:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read() or None
+    except OSError:
+        return None
+
+
+def _write_cached_lyrics(song_title, lyrics):
+    """Store lyrics for later runs; a failed write only costs a re-fetch"""
+    path = _lyrics_cache_path(song_title)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(Config.GENIUS_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(lyrics)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"  ⚠ Could not cache Genius lyrics: {e}")
+
+
 # ============================================================================
 # EXTRACTION METHOD 1: __PRELOADED_STATE__ JSON
 # ============================================================================
 def _extract_from_preloaded_state(html):
     """Extract lyrics from the embedded JSON state object"""
-    # Try multiple patterns as Genius changes their JS variable names
-    patterns = [
-        r'window\.__PRELOADED_STATE__\s*=\s*JSON\.parse\(\'(.*?)\'\);',
-        r'window\.__PRELOADED_STATE__\s*=\s*JSON\.parse\("(.*?)"\);',
-        r'window\.__PRELOADED_STATE__\s*=\s*(\{.*?\})\s*;',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, html, flags=re.DOTALL)
-        if match:
+    idx = html.find(_PRELOADED_STATE_MARKER)
+    while idx != -1:
+        end = idx + _PRELOADED_STATE_SPAN
+        for pattern, is_js_string in _PRELOADED_STATE_PATTERNS:
+            match = pattern.match(html, idx, end)
+            if not match:
+                continue
             try:
-                raw = match.group(1)
+                raw = match.group("raw")
                 
                 # Handle escaped JSON string (from JSON.parse)
-                if pattern.startswith(r'window\.__PRELOADED_STATE__\s*=\s*JSON\.parse'):
-                    # Unescape the string
-                    raw = raw.replace("\\'", "'")
-                    raw = raw.replace('\\"', '"')
-                    raw = raw.replace('\\\\', '\\')
-                    raw = raw.encode().decode('unicode_escape')
+                if is_js_string:
+                    raw = _decode_js_string(raw, match.group(1))
                 
                 state_data = json.loads(raw)
                 
@@ -233,12 +429,28 @@ def _extract_from_preloaded_state(html):
                 if lyrics_text and len(lyrics_text.strip()) > 10:
                     return lyrics_text
                     
-            except (json.JSONDecodeError, UnicodeDecodeError, KeyError) as e:
+            except (json.JSONDecodeError, KeyError) as e:
                 continue
+        
+        idx = html.find(_PRELOADED_STATE_MARKER, idx + 1)
     
     return None
 
 
+def _decode_js_string(body, quote):
+    """
+    Decode the body of a JS string literal in one pass.
+    
+    JSON string escapes are a subset of JS ones, so after turning the
+    JS-only \\' into ' and escaping bare " (legal inside '...'), json.loads
+    does the unescaping in C. Non-ASCII text passes through untouched.
+    """
+    if quote == "'":
+        body = body.replace("\\'", "'")
+        body = _BARE_DQUOTE_RE.sub(r'\1\\"', body)
+    return json.loads('"' + body + '"', strict=False)
+
+
 def _traverse_state_for_lyrics(state_data):
     """Try multiple JSON paths to find lyrics data"""
     # Path variations Genius has used over time
@@ -265,45 +477,86 @@ def _traverse_state_for_lyrics(state_data):
     return None
 
 
+_LIST_FRAME = object()   # frame kinds for _extract_text_recursive besides tags
+_ROOT_FRAME = object()
+
+
 def _extract_text_recursive(node):
-    """Recursively extract text from Genius JSON lyrics structure"""
-    if isinstance(node, str):
-        return node
+    """
+    Extract text from Genius JSON lyrics structure.
     
-    if isinstance(node, dict):
-        tag = node.get("tag", "")
-        children = node.get("children", [])
-        
-        pieces = []
-        for child in children:
-            piece = _extract_text_recursive(child)
-            if piece:
-                pieces.append(piece)
-        
-        result = ""
-        if tag == "br":
-            result = "\n"
-        elif tag in ("p", "div"):
-            result = "\n".join(pieces) + "\n"
-        else:
-            result = "".join(pieces)
+    Walks the tree with an explicit stack of [children, pieces, kind] frames
+    instead of recursing: deep/wide bodies cost no Python frames, and each
+    node's text is joined once when its frame closes. Output is the same as
+    the recursive form: lists join non-empty parts with newlines, p/div do
+    too plus a trailing newline, br is a newline, other tags concatenate.
+    """
+    stack = [[iter((node,)), [], _ROOT_FRAME]]
+    while True:
+        frame = stack[-1]
+        child = next(frame[0], frame)
         
-        return result
-    
-    if isinstance(node, list):
-        pieces = []
-        for child in node:
-            piece = _extract_text_recursive(child)
-            if piece:
-                pieces.append(piece)
-        return "\n".join(pieces)
-    
-    return ""
+        if child is frame:
+            # All children done: fold this node into its parent's pieces
+            stack.pop()
+            pieces, kind = frame[1], frame[2]
+            if kind is _ROOT_FRAME:
+                return pieces[0] if pieces else ""
+            if kind is _LIST_FRAME:
+                text = "\n".join(pieces)
+            elif kind == "br":
+                text = "\n"
+            elif kind in ("p", "div"):
+                text = "\n".join(pieces) + "\n"
+            else:
+                text = "".join(pieces)
+            if text:
+                stack[-1][1].append(text)
+        elif isinstance(child, str):
+            if child:
+                frame[1].append(child)
+        elif isinstance(child, dict):
+            stack.append([iter(child.get("children", [])), [], child.get("tag", "")])
+        elif isinstance(child, list):
+            stack.append([iter(child), [], _LIST_FRAME])
 
 
 # ============================================================================
-# EXTRACTION METHOD 2: BeautifulSoup HTML parsing
+# EXTRACTION METHOD 2: HTML parsing (lxml, then BeautifulSoup)
 # ============================================================================
+def _extract_with_lxml(html):
+    """Same container lookup as the BS4 path, with the tree built in C"""
+    try:
+        tree = lxml.html.fromstring(html)
+        
+        containers = (
+            tree.xpath('//div[@data-lyrics-container="true"]')
+            or tree.xpath('//div[contains(@class, "Lyrics__Container")]')
+            or tree.xpath('//div[contains(@class, "lyrics")]')
+        )
+        if not containers:
+            return None
+        
+        lyrics_parts = []
+        for container in containers:
+            # <br> becomes a newline: prepend it to the text that follows
+            for br in container.iter("br"):
+                br.tail = "\n" + (br.tail or "")
+            
+            text = container.text_content()
+            if text.strip():
+                lyrics_parts.append(text.strip())
+        
+        if not lyrics_parts:
+            return None
+        
+        return "\n".join(lyrics_parts)
+        
+    except Exception as e:
+        print(f"  lxml extraction error: {e}")
+        return None
+
+
 def _extract_with_beautifulsoup(html):
     """Extract lyrics using BeautifulSoup for robust HTML parsing"""
     if not HAS_BS4:
@@ -317,11 +570,11 @@ def _extract_with_beautifulsoup(html):
         
         if not containers:
             # Fallback: Try class-based selectors Genius has used
-            containers = soup.find_all("div", class_=re.compile(r"Lyrics__Container"))
+            containers = soup.find_all("div", class_=_LYRICS_CONTAINER_CLASS_RE)
         
         if not containers:
             # Another fallback: look for the lyrics root
-            containers = soup.find_all("div", class_=re.compile(r"lyrics"))
+            containers = soup.find_all("div", class_=_LYRICS_CLASS_RE)
         
         if not containers:
             return None
@@ -352,19 +605,11 @@ def _extract_with_beautifulsoup(html):
 def _extract_with_regex(html):
     """Last-resort regex extraction"""
     # Find all lyrics container divs
-    blocks = re.findall(
-        r'<div[^>]+data-lyrics-container="true"[^>]*>(.*?)</div>',
-        html,
-        flags=re.DOTALL | re.IGNORECASE
-    )
+    blocks = _CONTAINER_DIV_RE.findall(html)
     
     if not blocks:
         # Try class-based pattern
-        blocks = re.findall(
-            r'<div[^>]+class="[^"]*Lyrics__Container[^"]*"[^>]*>(.*?)</div>',
-            html,
-            flags=re.DOTALL | re.IGNORECASE
-        )
+        blocks = _CONTAINER_CLASS_DIV_RE.findall(html)
     
     if not blocks:
         return None
@@ -372,9 +617,9 @@ def _extract_with_regex(html):
     cleaned = []
     for block in blocks:
         # Replace <br> with newlines
-        block = re.sub(r'<br\s*/?>', '\n', block)
+        block = _BR_RE.sub('\n', block)
         # Remove all HTML tags
-        block = re.sub(r'<.*?>', '', block, flags=re.DOTALL)
+        block = _TAG_RE.sub('', block)
         # Unescape HTML entities
         block = unescape(block)
         if block.strip():
@@ -408,24 +653,7 @@ def _clean_lyrics(text):
             continue
         
         # Skip known metadata/junk lines
-        lower = ln.lower()
-        skip_patterns = [
-            "contributors",
-            "translations",
-            "embed",
-            "you might also like",
-            r"^see\s+.*\s+live\s*$",  # #6: Anchored — only whole-line "See X Live"
-            r"^\d+$",                  # Just numbers
-            r"^\s*genius\s*$",         # #6: Whole-line only — don't strip lyrics containing "genius"
-        ]
-        
-        should_skip = False
-        for pattern in skip_patterns:
-            if re.search(pattern, lower):
-                should_skip = True
-                break
-        
-        if should_skip:
+        if _SKIP_RE.search(ln.lower()):
             continue
         
         lines.append(ln)
@@ -439,7 +667,7 @@ def _clean_lyrics(text):
     result = "\n".join(lines)
     
     # Remove excessive blank lines (more than 2 consecutive)
-    result = re.sub(r'\n{3,}', '\n\n', result)
+    result = _MULTI_BLANK_RE.sub('\n\n', result)
     
     return result if result.strip() else None
 
@@ -473,59 +701,46 @@ def _find_best_hit(hits, artist, title):
     Filters out translations (Türkçe Çeviri, Tradução, Traduction, etc.)
     which Genius sometimes ranks higher than the original.
     """
-    # Translation indicators in Genius result titles
-    translation_markers = [
-        "türkçe çeviri", "tradução", "traduction", "traducción",
-        "перевод", "översättning", "übersetzung", "terjemahan",
-        "翻訳", "번역", "traduzione", "vertaling",
-        "genius türkçe", "genius brasil", "genius traductions",
-        "genius traducciones", "genius traduções",
-    ]
-    
-    def _is_translation(hit):
-        full_title = hit["result"].get("full_title", "").lower()
-        primary_artist = hit["result"].get("primary_artist", {}).get("name", "").lower()
-        # Check title and artist for translation markers
-        for marker in translation_markers:
-            if marker in full_title or marker in primary_artist:
-                return True
-        return False
+    # (hit, primary artist, full title), lowercased once per hit
+    enriched = []
+    for hit in hits:
+        result = hit["result"]
+        enriched.append((
+            hit,
+            result.get("primary_artist", {}).get("name", "").lower(),
+            result.get("full_title", "").lower(),
+        ))
     
     # Split hits into originals and translations
-    originals = [h for h in hits if not _is_translation(h)]
+    originals = [e for e in enriched
+                 if not _TRANSLATION_RE.search(f"{e[2]}\n{e[1]}")]
     
     # If no originals found, use all hits (better than nothing)
-    pool = originals if originals else hits
+    pool = originals if originals else enriched
     
     if not artist:
-        return pool[0]
+        return pool[0][0]
     
     artist_lower = artist.lower()
+    title_lower = title.lower() if title else ""
     
-    # First pass: exact artist match in non-translations
-    for hit in pool:
-        result = hit["result"]
-        primary_artist = result.get("primary_artist", {}).get("name", "").lower()
-        
+    # One pass: an exact artist match wins outright; otherwise keep the
+    # first artist-in-title and the first title match, in that order
+    in_title = title_match = None
+    for hit, primary_artist, full_title in pool:
         if artist_lower in primary_artist or primary_artist in artist_lower:
             return hit
-    
-    # Second pass: artist mentioned in full title of non-translations
-    for hit in pool:
-        result = hit["result"]
-        full_title = result.get("full_title", "").lower()
-        
-        if artist_lower in full_title:
-            return hit
-    
-    # Third pass: title match in non-translations
-    title_lower = title.lower() if title else ""
-    for hit in pool:
-        result = hit["result"]
-        hit_title = result.get("title", "").lower()
-        
-        if title_lower in hit_title or hit_title in title_lower:
-            return hit
+        if in_title is None and artist_lower in full_title:
+            in_title = hit
+        if title_match is None:
+            hit_title = hit["result"].get("title", "").lower()
+            if title_lower in hit_title or hit_title in title_lower:
+                title_match = hit
+    
+    if in_title is not None:
+        return in_title
+    if title_match is not None:
+        return title_match
     
     # Default to first non-translation (or first overall)
-    return pool[0]
\ No newline at end of file
+    return pool[0][0]
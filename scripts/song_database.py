@@ -10,6 +10,8 @@ Each template has its own lyrics column:
 import sqlite3
 import json
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
 
@@ -22,6 +24,8 @@ class SongDatabase:
             db_path = str(Path(__file__).parent.parent / "database" / "songs.db")
         
         self.db_path = db_path
+        self._bulk_conn = None
+        self._bulk_thread = None
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self.init_database()
     
@@ -56,16 +60,59 @@ class SongDatabase:
             except sqlite3.OperationalError:
                 pass  # Column already exists
         
+        # Cover palettes keyed by image content, shared across songs
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS palettes (
+                image_hash TEXT PRIMARY KEY,
+                colors TEXT NOT NULL
+            )
+        """)
+        
+        conn.commit()
+        conn.close()
+    
+    # ========================================================================
+    # CONNECTIONS / BULK WRITES
+    # ========================================================================
+    
+    def _connect(self):
+        """Per-call connection, or the open bulk() one on the thread that owns it"""
+        if self._bulk_conn is not None and self._bulk_thread == threading.get_ident():
+            return self._bulk_conn
+        return sqlite3.connect(self.db_path)
+    
+    def _release(self, conn):
+        """Commit and close a per-call connection; bulk() commits its own"""
+        if conn is self._bulk_conn:
+            return
         conn.commit()
         conn.close()
     
+    @contextmanager
+    def bulk(self):
+        """Run several writes from this thread as one transaction (one commit)"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("BEGIN IMMEDIATE")
+        self._bulk_conn = conn
+        self._bulk_thread = threading.get_ident()
+        try:
+            yield self
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._bulk_conn = None
+            self._bulk_thread = None
+            conn.close()
+    
     # ========================================================================
     # CORE CRUD
     # ========================================================================
     
     def get_song(self, song_title):
         """Get song parameters from database (shared fields only)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -76,7 +123,7 @@ class SongDatabase:
         """, (song_title,))
         
         row = cursor.fetchone()
-        conn.close()
+        self._release(conn)
         
         if not row:
             return None
@@ -94,7 +141,7 @@ class SongDatabase:
     def add_song(self, song_title, youtube_url, start_time, end_time,
                  genius_image_url=None, transcribed_lyrics=None, colors=None, beats=None):
         """Add new song or update existing (COALESCE preserves existing data)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         lyrics_json = json.dumps(transcribed_lyrics) if transcribed_lyrics else None
@@ -118,12 +165,11 @@ class SongDatabase:
         """, (song_title, youtube_url, start_time, end_time,
               genius_image_url, lyrics_json, colors_json, beats_json))
         
-        conn.commit()
-        conn.close()
+        self._release(conn)
     
     def mark_song_used(self, song_title):
         """Increment use_count and update last_used timestamp"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -133,8 +179,7 @@ class SongDatabase:
             WHERE LOWER(song_title) = LOWER(?)
         """, (song_title,))
         
-        conn.commit()
-        conn.close()
+        self._release(conn)
     
     # ========================================================================
     # AURORA-SPECIFIC LYRICS
@@ -142,7 +187,7 @@ class SongDatabase:
     
     def update_lyrics(self, song_title, transcribed_lyrics):
         """Update Aurora transcribed_lyrics column"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         lyrics_json = json.dumps(transcribed_lyrics) if transcribed_lyrics else None
@@ -153,8 +198,7 @@ class SongDatabase:
             WHERE LOWER(song_title) = LOWER(?)
         """, (lyrics_json, song_title))
         
-        conn.commit()
-        conn.close()
+        self._release(conn)
     
     # ========================================================================
     # MONO-SPECIFIC LYRICS
@@ -162,7 +206,7 @@ class SongDatabase:
     
     def get_mono_lyrics(self, song_title):
         """Get Mono-format lyrics (word-level timestamps)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -171,7 +215,7 @@ class SongDatabase:
         """, (song_title,))
         
         row = cursor.fetchone()
-        conn.close()
+        self._release(conn)
         
         if not row or not row[0]:
             return None
@@ -180,7 +224,7 @@ class SongDatabase:
     
     def update_mono_lyrics(self, song_title, mono_lyrics):
         """Update Mono-format lyrics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         lyrics_json = json.dumps(mono_lyrics) if mono_lyrics else None
@@ -191,8 +235,7 @@ class SongDatabase:
             WHERE LOWER(song_title) = LOWER(?)
         """, (lyrics_json, song_title))
         
-        conn.commit()
-        conn.close()
+        self._release(conn)
     
     # ========================================================================
     # ONYX-SPECIFIC LYRICS
@@ -200,7 +243,7 @@ class SongDatabase:
     
     def get_onyx_lyrics(self, song_title):
         """Get Onyx-format lyrics (word-level timestamps + colors)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -209,7 +252,7 @@ class SongDatabase:
         """, (song_title,))
         
         row = cursor.fetchone()
-        conn.close()
+        self._release(conn)
         
         if not row or not row[0]:
             return None
@@ -218,7 +261,7 @@ class SongDatabase:
     
     def update_onyx_lyrics(self, song_title, onyx_lyrics):
         """Update Onyx-format lyrics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         lyrics_json = json.dumps(onyx_lyrics) if onyx_lyrics else None
@@ -229,8 +272,7 @@ class SongDatabase:
             WHERE LOWER(song_title) = LOWER(?)
         """, (lyrics_json, song_title))
         
-        conn.commit()
-        conn.close()
+        self._release(conn)
     
     # ========================================================================
     # SHARED FIELD UPDATES
@@ -238,7 +280,7 @@ class SongDatabase:
     
     def update_image_url(self, song_title, genius_image_url):
         """Update Genius image URL"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -247,12 +289,11 @@ class SongDatabase:
             WHERE LOWER(song_title) = LOWER(?)
         """, (genius_image_url, song_title))
         
-        conn.commit()
-        conn.close()
+        self._release(conn)
     
     def update_colors_and_beats(self, song_title, colors, beats):
         """Update colors and beats"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         colors_json = json.dumps(colors) if colors else None
@@ -264,8 +305,7 @@ class SongDatabase:
             WHERE LOWER(song_title) = LOWER(?)
         """, (colors_json, beats_json, song_title))
         
-        conn.commit()
-        conn.close()
+        self._release(conn)
     
     # ========================================================================
     # QUERIES
@@ -273,7 +313,7 @@ class SongDatabase:
     
     def list_all_songs(self):
         """Get list of all songs ordered by last used"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -283,12 +323,12 @@ class SongDatabase:
         """)
         
         songs = cursor.fetchall()
-        conn.close()
+        self._release(conn)
         return songs
     
     def search_songs(self, query):
         """Search for songs by partial title match"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -300,12 +340,27 @@ class SongDatabase:
         """, (f"%{query}%",))
         
         songs = cursor.fetchall()
-        conn.close()
+        self._release(conn)
         return songs
     
+    def list_titles(self):
+        """All song titles, ranked the way search_songs orders its results"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            SELECT song_title
+            FROM songs 
+            ORDER BY use_count DESC, last_used DESC
+        """)
+        
+        titles = [row[0] for row in cursor.fetchall()]
+        self._release(conn)
+        return titles
+    
     def delete_song(self, song_title):
         """Delete a song from the database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -314,13 +369,12 @@ class SongDatabase:
         """, (song_title,))
         
         deleted = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
+        self._release(conn)
         return deleted
     
     def get_stats(self):
         """Get database statistics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("SELECT COUNT(*) FROM songs")
@@ -332,10 +386,36 @@ class SongDatabase:
         cursor.execute("SELECT SUM(use_count) FROM songs")
         total_uses = cursor.fetchone()[0] or 0
         
-        conn.close()
+        self._release(conn)
         
         return {
             "total_songs": total_songs,
             "cached_lyrics": cached_lyrics,
             "total_uses": total_uses
         }
+    
+    # ========================================================================
+    # COVER PALETTES
+    # ========================================================================
+    
+    def get_palette(self, image_hash):
+        """Colors previously extracted from a cover with this content hash"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT colors FROM palettes WHERE image_hash = ?", (image_hash,))
+        row = cursor.fetchone()
+        self._release(conn)
+        
+        return json.loads(row[0]) if row else None
+    
+    def save_palette(self, image_hash, colors):
+        """Remember the colors extracted from a cover"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            INSERT OR REPLACE INTO palettes (image_hash, colors) VALUES (?, ?)
+        """, (image_hash, json.dumps(colors)))
+        
+        self._release(conn)
@@ -20,6 +20,7 @@ import os
 import json
 import re
 import gc
+import threading
 
 from pydub import AudioSegment
 from stable_whisper import load_model
@@ -31,6 +32,15 @@ try:
 except ImportError:
     HAS_TORCH = False
 
+# Optional CTranslate2 backend (pip install faster-whisper); stable-ts wraps it
+# so results keep the same WhisperResult API as the openai-whisper backend.
+try:
+    import faster_whisper  # noqa: F401
+    from stable_whisper import load_faster_whisper
+    HAS_FASTER_WHISPER = True
+except ImportError:
+    HAS_FASTER_WHISPER = False
+
 from scripts.config import Config
 
 
@@ -40,59 +50,121 @@ from scripts.config import Config
 
 _cached_model = None
 _cached_on_cpu = None
+_cached_is_faster = False
+# Serializes loading against warmup_whisper() running on another thread
+_model_lock = threading.RLock()
 
 
-def load_whisper_model(force_cpu=False):
-    """Load Whisper model with caching — skip reload if same config."""
-    global _cached_model, _cached_on_cpu
-
-    if _cached_model is not None and _cached_on_cpu == force_cpu:
-        print(f"  \u267b Reusing cached {Config.WHISPER_MODEL} model")
-        return _cached_model
-
-    # Unload existing if config changed
-    if _cached_model is not None:
-        unload_model()
+def use_faster_whisper():
+    """faster-whisper is used when installed, unless WHISPER_BACKEND=openai."""
+    return HAS_FASTER_WHISPER and Config.WHISPER_BACKEND != "openai"
 
-    os.makedirs(Config.WHISPER_CACHE_DIR, exist_ok=True)
 
-    if force_cpu and HAS_TORCH:
-        original_visible = os.environ.get("CUDA_VISIBLE_DEVICES")
-        os.environ["CUDA_VISIBLE_DEVICES"] = ""
-        try:
-            print(f"  Loading {Config.WHISPER_MODEL} on CPU...")
+def load_whisper_model(force_cpu=False):
+    """Load Whisper model with caching — skip reload if same config."""
+    global _cached_model, _cached_on_cpu, _cached_is_faster
+
+    with _model_lock:
+        if _cached_model is not None and _cached_on_cpu == force_cpu:
+            print(f"  \u267b Reusing cached {Config.WHISPER_MODEL} model")
+            return _cached_model
+
+        # Unload existing if config changed
+        if _cached_model is not None:
+            unload_model()
+
+        os.makedirs(Config.WHISPER_CACHE_DIR, exist_ok=True)
+
+        if use_faster_whisper():
+            on_gpu = not force_cpu and HAS_TORCH and torch.cuda.is_available()
+            device = "cuda" if on_gpu else "cpu"
+            # int8 weights halve memory traffic; fp16 activations on GPU
+            compute_type = "int8_float16" if on_gpu else "int8"
+            print(f"  Loading {Config.WHISPER_MODEL} "
+                  f"(faster-whisper, {device}, {compute_type})...")
+            _cached_model = load_faster_whisper(
+                Config.WHISPER_MODEL,
+                device=device,
+                compute_type=compute_type,
+                download_root=Config.WHISPER_CACHE_DIR,
+            )
+        elif force_cpu and HAS_TORCH:
+            original_visible = os.environ.get("CUDA_VISIBLE_DEVICES")
+            os.environ["CUDA_VISIBLE_DEVICES"] = ""
+            try:
+                print(f"  Loading {Config.WHISPER_MODEL} on CPU...")
+                _cached_model = load_model(
+                    Config.WHISPER_MODEL,
+                    download_root=Config.WHISPER_CACHE_DIR,
+                    in_memory=False,
+                )
+            finally:
+                if original_visible is not None:
+                    os.environ["CUDA_VISIBLE_DEVICES"] = original_visible
+                else:
+                    os.environ.pop("CUDA_VISIBLE_DEVICES", None)
+        else:
+            print(f"  Loading {Config.WHISPER_MODEL}...")
             _cached_model = load_model(
                 Config.WHISPER_MODEL,
                 download_root=Config.WHISPER_CACHE_DIR,
                 in_memory=False,
             )
-        finally:
-            if original_visible is not None:
-                os.environ["CUDA_VISIBLE_DEVICES"] = original_visible
-            else:
-                os.environ.pop("CUDA_VISIBLE_DEVICES", None)
-    else:
-        print(f"  Loading {Config.WHISPER_MODEL}...")
-        _cached_model = load_model(
-            Config.WHISPER_MODEL,
-            download_root=Config.WHISPER_CACHE_DIR,
-            in_memory=False,
-        )
 
-    _cached_on_cpu = force_cpu
-    return _cached_model
+        _cached_is_faster = use_faster_whisper()
+        _cached_on_cpu = force_cpu
+        return _cached_model
 
 
 def unload_model():
     """Explicit cleanup when truly done."""
-    global _cached_model, _cached_on_cpu
+    global _cached_model, _cached_on_cpu, _cached_is_faster
     if _cached_model is not None:
         del _cached_model
         _cached_model = None
         _cached_on_cpu = None
+        _cached_is_faster = False
         clear_vram()
 
 
+def warmup_whisper():
+    """
+    Load the model and run it once on a second of silence, so the first job
+    doesn't pay for weight page-in and CUDA kernel setup. Meant to run on a
+    side thread while audio downloads; a job reaching Whisper first waits on
+    the model lock instead of loading a second copy.
+    """
+    import numpy as np
+
+    with _model_lock:
+        if _cached_model is not None:
+            return
+        model = load_whisper_model()
+        try:
+            _transcribe(model, np.zeros(16000, dtype=np.float32),
+                        language="en", vad=False, regroup=False)
+            print(f"  \u2713 Whisper warmed up")
+        except Exception as e:
+            print(f"  \u26a0 Whisper warmup pass failed: {e}")
+
+
+def _transcribe(model, audio, **params):
+    """Stable-ts transcription for whichever backend loaded `model`."""
+    if _cached_is_faster:
+        return model.transcribe_stable(audio, **params)
+    return model.transcribe(audio, **params)
+
+
+def _load_audio_16k(audio_path):
+    """Whisper-ready float32 samples, or the path itself if decoding fails."""
+    try:
+        from whisper.audio import load_audio
+        return load_audio(audio_path)
+    except Exception as e:
+        print(f"  \u26a0 Could not pre-decode audio ({e}); passes will decode it")
+        return audio_path
+
+
 def clear_vram():
     """Clear GPU memory between passes / after model unload."""
     gc.collect()
@@ -415,6 +487,10 @@ def multi_pass_transcribe(audio_path, prompt, duration, language,
     model = None
     used_cpu_fallback = False
 
+    # Decode to 16 kHz mono once; every pass (and the CPU fallback) reuses
+    # the samples instead of re-running ffmpeg on the file.
+    audio = _load_audio_16k(audio_path)
+
     try:
         model = load_whisper_model()
 
@@ -422,7 +498,7 @@ def multi_pass_transcribe(audio_path, prompt, duration, language,
             try:
                 clear_vram()
                 print(f"  {p['name']}...")
-                result = model.transcribe(audio_path, **p["params"])
+                result = _transcribe(model, audio, **p["params"])
 
                 if not result or not result.segments:
                     print(f"    \u2192 0 segments")
@@ -454,7 +530,7 @@ def multi_pass_transcribe(audio_path, prompt, duration, language,
                     model = load_whisper_model(force_cpu=True)
                     used_cpu_fallback = True
                     try:
-                        result = model.transcribe(audio_path, **p["params"])
+                        result = _transcribe(model, audio, **p["params"])
                         if result and result.segments:
                             count = sum(
                                 1 for s in result.segments
@@ -675,7 +751,7 @@ def save_whisper_cache(job_folder, segments):
                 entry["words"] = seg["words"]
             data.append(entry)
         with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
         print(f"  \U0001f4be Cached {len(data)} segments to whisper_raw.json")
     except Exception as e:
         print(f"  \u26a0 Failed to save Whisper cache: {e}")